@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from PlayerNames import normalized
+
+BOARD_COLUMNS = ['NAME', 'STAT_TYPE', 'LINE', 'ODDS_TYPE', 'GAME_DATE']
+NEAREST_COLUMNS = ['NEAREST BOOK', 'NEAREST MARKET', 'NEAREST LINE', 'NEAREST OVER', 'NEAREST UNDER']
+
+def book_prices(odds, category_markets):
+    """
+    One row per (book, market, player, line) with OVER/UNDER prices side by side,
+    tagged with the PrizePicks stat type the market prices.
+    """
+    market_stats = {market: stat for stat, markets in category_markets.items() for market in markets}
+    odds = odds[odds['OVER/UNDER'].isin(['Over', 'Under'])]
+    prices = pd.DataFrame({
+        'BOOKMAKER': odds['BOOKMAKER'].astype(object),
+        'MARKET': odds['CATEGORY'].astype(object),
+        'STAT_TYPE': odds['CATEGORY'].astype(object).map(market_stats),
+        'KEY': normalized(odds['NAME']),
+        'SIDE': odds['OVER/UNDER'].astype(object).str.upper(),
+        'BOOK LINE': odds['LINE'],
+        'ODDS': odds['ODDS'],
+    }).dropna(subset=['STAT_TYPE', 'BOOK LINE'])
+    index = ['BOOKMAKER', 'MARKET', 'STAT_TYPE', 'KEY', 'BOOK LINE']
+    prices = prices.drop_duplicates(index + ['SIDE'], keep='last')
+    return prices.pivot(index=index, columns='SIDE', values='ODDS').reindex(columns=['OVER', 'UNDER']).reset_index()
+
+def compare_board(prizepicks, odds, category_markets):
+    """
+    Wide PrizePicks-vs-sportsbook table, one row per PrizePicks projection.
+
+    Projections and book prices are joined once on normalized (player, stat type);
+    main and alternate markets are pooled, and for every book the line closest to
+    the PrizePicks line is kept. Each book gets '<book> LINE/OVER/UNDER' columns and
+    the NEAREST ... columns hold the closest line over all books.
+    """
+    board = prizepicks[BOARD_COLUMNS].copy()
+    board['STAT_TYPE'] = board['STAT_TYPE'].astype(object)
+    board['NAME'] = board['NAME'].astype(object)
+    board['KEY'] = normalized(board['NAME'])
+    board['ROW'] = np.arange(len(board))
+
+    prices = book_prices(odds, category_markets)
+    joined = board[['ROW', 'KEY', 'STAT_TYPE', 'LINE']].merge(prices, on=['KEY', 'STAT_TYPE'], how='inner')
+    joined['DISTANCE'] = (joined['BOOK LINE'] - joined['LINE']).abs()
+    # Closest line per (projection, book); on a tie prefer the line that has both sides priced
+    joined['ONE_SIDED'] = joined[['OVER', 'UNDER']].isna().any(axis=1)
+    joined = joined.sort_values(['ROW', 'BOOKMAKER', 'DISTANCE', 'ONE_SIDED'], kind='stable')
+    per_book = joined.drop_duplicates(['ROW', 'BOOKMAKER'])
+
+    wide = per_book.pivot(index='ROW', columns='BOOKMAKER', values=['BOOK LINE', 'OVER', 'UNDER'])
+    books = sorted(per_book['BOOKMAKER'].unique())
+    wide.columns = [f"{book} {'LINE' if field == 'BOOK LINE' else field}" for field, book in wide.columns]
+    wide = wide.reindex(columns=[f"{book} {field}" for book in books for field in ['LINE', 'OVER', 'UNDER']])
+
+    nearest = per_book.sort_values(['ROW', 'DISTANCE', 'ONE_SIDED'], kind='stable').drop_duplicates('ROW').set_index('ROW')
+    nearest = nearest[['BOOKMAKER', 'MARKET', 'BOOK LINE', 'OVER', 'UNDER']]
+    nearest.columns = NEAREST_COLUMNS
+
+    table = board.drop(columns='KEY').set_index('ROW').rename(columns={'LINE': 'PRIZEPICKS LINE'})
+    table = table.join(nearest).join(wide)
+    table['BOOKS'] = per_book.groupby('ROW').size().reindex(table.index, fill_value=0)
+    return table.reset_index(drop=True)
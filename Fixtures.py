@@ -0,0 +1,205 @@
+"""
+Record/replay fixtures for the odds, PrizePicks and ESPN endpoints.
+
+Record: set FIXTURE_RECORD_DIRECTORY and run any scraper; every response made
+through new_session() is saved under that directory.
+
+Replay: serve the recordings locally and point the scrapers at the server
+
+    python Fixtures.py serve --directory fixtures --port 8765 --latency 0.05 --rate-limit 20
+
+then export the ODDS_API_URL / PRIZEPICKS_API_URL / ESPN_API_URL values it prints.
+Recordings are keyed by host, path and query (minus apiKey), and the server
+exposes each recorded host under its own path prefix: http://127.0.0.1:8765/<host>/...
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl, urlencode
+import requests
+from Supplier import Supplier
+
+# Headers worth replaying; the quota headers matter to OddsClient
+KEPT_HEADERS = ['Content-Type', 'x-requests-used', 'x-requests-remaining', 'x-requests-last']
+
+def fixture_key(method, host, path, query):
+    params = sorted((k, v) for k, v in parse_qsl(query, keep_blank_values=True) if k != 'apiKey')
+    return f"{method.upper()} {host}{path}?{urlencode(params)}"
+
+def fixture_path(directory, key):
+    host = key.split(' ', 1)[1].split('/', 1)[0]
+    return os.path.join(directory, host, f"{hashlib.sha1(key.encode()).hexdigest()[:20]}.json")
+
+def save_fixture(directory, response):
+    url = urlsplit(response.request.url)
+    key = fixture_key(response.request.method, url.netloc, url.path, url.query)
+    path = fixture_path(directory, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump({
+            'key': key,
+            'status': response.status_code,
+            'headers': {h: response.headers[h] for h in KEPT_HEADERS if h in response.headers},
+            'body': response.text,
+            'recorded_at': time.time(),
+        }, file)
+
+def load_fixture(directory, key):
+    try:
+        with open(fixture_path(directory, key), 'r') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+class RecordingSession(requests.Session):
+    """
+    requests.Session that writes every response it receives to a fixture directory.
+    """
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def request(self, method, url, *args, **kwargs):
+        response = super().request(method, url, *args, **kwargs)
+        with self._lock:
+            save_fixture(self.directory, response)
+        return response
+
+def new_session():
+    # The one place scrapers get their HTTP session, so recording can be switched on by env
+    directory = Supplier().getRecordDirectory()
+    return RecordingSession(directory) if directory else requests.Session()
+
+class FixtureServer():
+    """
+    Local stand-in HTTP server replaying recorded responses.
+
+    latency: seconds added to every response (plus up to `jitter` more).
+    rate_limit / rate_window: at most rate_limit requests per rate_window seconds,
+    anything above gets a 429 like the live APIs.
+    """
+    def __init__(self, directory='fixtures', host='127.0.0.1', port=0, latency=0.0, jitter=0.0,
+                 rate_limit=None, rate_window=1.0):
+        self.directory = directory
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.stats = {'served': 0, 'missing': 0, 'throttled': 0}
+        self._recent = deque()
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self.handler())
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_url(self, live_url):
+        # https://api.prizepicks.com/ -> http://127.0.0.1:<port>/api.prizepicks.com/
+        url = urlsplit(live_url)
+        return f"{self.url}/{url.netloc}{url.path}"
+
+    def environment(self):
+        supplier = Supplier()
+        return {
+            'ODDS_API_URL': self.base_url(supplier.getOddsURL()),
+            'PRIZEPICKS_API_URL': self.base_url(supplier.getPrizePicksURL()),
+            'ESPN_API_URL': self.base_url(supplier.getESPNURL()),
+        }
+
+    def throttled(self):
+        if not self.rate_limit:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and now - self._recent[0] > self.rate_window:
+                self._recent.popleft()
+            if len(self._recent) >= self.rate_limit:
+                return True
+            self._recent.append(now)
+            return False
+
+    def handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                host, _, path = url.path.lstrip('/').partition('/')
+                if server.latency or server.jitter:
+                    time.sleep(server.latency + random.uniform(0, server.jitter))
+                if server.throttled():
+                    server.count('throttled')
+                    self.reply(429, {'Retry-After': str(server.rate_window)}, 'Too Many Requests')
+                    return
+                fixture = load_fixture(server.directory, fixture_key('GET', host, f"/{path}", url.query))
+                if fixture is None:
+                    server.count('missing')
+                    self.reply(404, {}, f"No fixture recorded for {host}/{path}?{url.query}")
+                    return
+                server.count('served')
+                self.reply(fixture['status'], fixture['headers'], fixture['body'])
+
+            def reply(self, status, headers, body):
+                payload = body.encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Replay recorded API responses locally')
+    parser.add_argument('command', choices=['serve'])
+    parser.add_argument('--directory', default='fixtures')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=int, default=None)
+    parser.add_argument('--rate-window', type=float, default=1.0)
+    args = parser.parse_args()
+
+    server = FixtureServer(args.directory, args.host, args.port, args.latency, args.jitter,
+                           args.rate_limit, args.rate_window)
+    for name, value in server.environment().items():
+        print(f"export {name}={value}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print(f"Stats: {server.stats}")
+        server.stop()
@@ -0,0 +1,81 @@
+import os
+import time
+from datetime import datetime, timezone
+import pandas as pd
+
+KEY_COLUMNS = ['BOOKMAKER', 'CATEGORY', 'NAME', 'OVER/UNDER']
+LOG_COLUMNS = ['TIMESTAMP', 'CHANGE'] + KEY_COLUMNS + ['LINE', 'ODDS', 'PREV_LINE', 'PREV_ODDS']
+
+def prop_keys(df):
+    # Alternate markets carry a whole ladder of lines per player/side, so the line is
+    # part of the identity there; everywhere else one line per side moves over time
+    keys = df[KEY_COLUMNS].copy()
+    alternate = df['CATEGORY'].astype(str).str.endswith('_alternate')
+    keys['LINE_KEY'] = df['LINE'].astype(str).where(alternate, '')
+    return keys
+
+def changed(current, previous):
+    # Yes/no markets have no line; NaN on both sides is not a move
+    return (current != previous) & ~(current.isna() & previous.isna())
+
+def diff_snapshots(previous, current, timestamp=None):
+    """
+    Rows of `current` that are new or whose LINE/ODDS differ from `previous`,
+    plus rows that disappeared, in the line-movement log layout.
+    """
+    timestamp = timestamp or datetime.now(timezone.utc).isoformat()
+    key = KEY_COLUMNS + ['LINE_KEY']
+    prev = pd.concat([prop_keys(previous), previous[['LINE', 'ODDS']]], axis=1).drop_duplicates(key, keep='last')
+    curr = pd.concat([prop_keys(current), current[['LINE', 'ODDS']]], axis=1).drop_duplicates(key, keep='last')
+
+    merged = curr.merge(prev, on=key, how='outer', suffixes=('', '_PREV'), indicator=True)
+    merged = merged.rename(columns={'LINE_PREV': 'PREV_LINE', 'ODDS_PREV': 'PREV_ODDS'})
+    moved = (merged['_merge'] == 'both') & (changed(merged['LINE'], merged['PREV_LINE']) | changed(merged['ODDS'], merged['PREV_ODDS']))
+    merged['CHANGE'] = None
+    merged.loc[merged['_merge'] == 'left_only', 'CHANGE'] = 'NEW'
+    merged.loc[merged['_merge'] == 'right_only', 'CHANGE'] = 'REMOVED'
+    merged.loc[moved, 'CHANGE'] = 'MOVED'
+
+    changes = merged[merged['CHANGE'].notna()].copy()
+    changes['TIMESTAMP'] = timestamp
+    return changes[LOG_COLUMNS].reset_index(drop=True)
+
+class LineMovementTracker():
+    """
+    Keeps the last odds snapshot and appends every change to a CSV log.
+    """
+    def __init__(self, log_file=None):
+        self.log_file = log_file
+        self.previous = pd.DataFrame(columns=KEY_COLUMNS + ['LINE', 'ODDS'])
+
+    def update(self, snapshot, timestamp=None):
+        changes = diff_snapshots(self.previous, snapshot, timestamp)
+        self.previous = snapshot
+        if self.log_file and not changes.empty:
+            os.makedirs(os.path.dirname(self.log_file) or '.', exist_ok=True)
+            changes.to_csv(self.log_file, mode='a', index=False, header=not os.path.exists(self.log_file))
+        return changes
+
+def default_log_file(sport):
+    return os.path.join('CSV_FILES', 'LINE_MOVEMENT', f"{sport}_{datetime.now().strftime('%Y%m%d')}.csv")
+
+def poll(finder, interval=60, max_polls=None, log_file=None, snapshot_store=None):
+    """
+    Generator over line-movement deltas for a prop finder.
+
+    The first yield is the finder's current board (every row NEW); after that the
+    odds client is re-queried every `interval` seconds and only changed rows are yielded.
+    With a SnapshotStore every board, the first included, is also saved to it.
+    """
+    tracker = LineMovementTracker(log_file or default_log_file(finder.odds_data.sport))
+    if snapshot_store is not None:
+        finder.saveSnapshot(snapshot_store)
+    yield tracker.update(finder.dataframe)
+    polls = 0
+    while max_polls is None or polls < max_polls:
+        time.sleep(interval)
+        finder.refreshOdds()
+        polls += 1
+        if snapshot_store is not None:
+            finder.saveSnapshot(snapshot_store)
+        yield tracker.update(finder.dataframe)
@@ -1,17 +1,18 @@
-import requests 
 from datetime import datetime
 import pytz
 import pandas as pd
 import joblib
 from Models.xgboost_model import *
+from Supplier import Supplier
+from Fixtures import new_session
 
 
 today = datetime.today().strftime('%Y-%m-%d')
 
 
 def get_espn_games(date_str=today):  # YYYYMMDD format
-    url = f"http://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date_str}"
-    response = requests.get(url)
+    url = f"{Supplier().getESPNURL()}basketball/nba/scoreboard?dates={date_str}"
+    response = new_session().get(url)
     data = response.json()
     
     # Define timezone objects
@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import tempfile
+import sqlite3
+import threading
+import time
+import numpy as np
+import pandas as pd
+
+class AdvancedStatsCache:
+    """
+    SQLite cache of advanced box score rows keyed by (GAME_ID, PLAYER_ID).
+
+    Rows are only ever appended (INSERT OR IGNORE), so a refresh costs the new
+    games rather than a rewrite of the whole history, and "which of these games
+    are missing" is answered from the primary-key index. Columns are whatever the
+    box score / game log frames carry; new ones are added as they appear.
+
+    Rows from the bulk game log carry PARTIAL = 1: they lack the box-score-only
+    START_POSITION/COMMENT, so a box score fetch may still replace them.
+
+    Games that failed to fetch sit in a failed_games queue with an attempt count
+    and an exponential-backoff NEXT_ATTEMPT time until a later fetch succeeds.
+    """
+    TABLE = 'advanced_stats'
+
+    def __init__(self, path='REGULAR_DATA/ADVANCED_STATS.sqlite', legacy_csv=None):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.TABLE} ("GAME_ID" TEXT NOT NULL, "PLAYER_ID" INTEGER NOT NULL, '
+                f'PRIMARY KEY ("GAME_ID", "PLAYER_ID"))'
+            )
+            self.connection.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS failed_games (GAME_ID TEXT PRIMARY KEY, ATTEMPTS INTEGER NOT NULL, '
+                'LAST_ERROR TEXT, NEXT_ATTEMPT REAL NOT NULL)'
+            )
+        if legacy_csv:
+            self.migrateCSV(legacy_csv)
+
+    def columns(self):
+        return [row[1] for row in self.connection.execute(f'PRAGMA table_info({self.TABLE})')]
+
+    def migrateCSV(self, csv_path):
+        # One-time import of the old ALL_REGULAR_DATA.csv cache
+        done = self.connection.execute('SELECT value FROM meta WHERE key = ?', (f'migrated:{csv_path}',)).fetchone()
+        if done or not os.path.exists(csv_path):
+            return 0
+        legacy = pd.read_csv(csv_path, dtype={'GAME_ID': str})
+        added = self.append(legacy)
+        with self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (f'migrated:{csv_path}', str(len(legacy))))
+        print(f"Migrated {added} rows from {csv_path} into {self.path}")
+        return added
+
+    def append(self, df, replace=False):
+        # replace=True lets a full box score overwrite the PARTIAL rows already cached for its players
+        if df.empty:
+            return 0
+        df = df.copy()
+        df['GAME_ID'] = df['GAME_ID'].astype(str)
+        df['PLAYER_ID'] = df['PLAYER_ID'].astype(int)
+        with self._lock, self.connection:
+            existing = set(self.columns())
+            for column in df.columns:
+                if column not in existing:
+                    if pd.api.types.is_integer_dtype(df[column]):
+                        kind = 'INTEGER'
+                    else:
+                        kind = 'REAL' if pd.api.types.is_numeric_dtype(df[column]) else 'TEXT'
+                    self.connection.execute(f'ALTER TABLE {self.TABLE} ADD COLUMN "{column}" {kind}')
+            names = ', '.join(f'"{column}"' for column in df.columns)
+            marks = ', '.join('?' for _ in df.columns)
+            rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+            before = self.connection.total_changes
+            verb = 'INSERT OR REPLACE' if replace else 'INSERT OR IGNORE'
+            self.connection.executemany(f'{verb} INTO {self.TABLE} ({names}) VALUES ({marks})', rows)
+            return self.connection.total_changes - before
+
+    def _withGameIds(self, game_ids, query):
+        # `query` reads the ids from a CTE "wanted(GAME_ID)" bound as one JSON parameter, so a lookup
+        # never writes (no temp table) and never leaves a transaction holding a lock on the file
+        ids = json.dumps([str(gid) for gid in game_ids])
+        with self._lock:
+            return pd.read_sql_query('WITH wanted(GAME_ID) AS (SELECT DISTINCT value FROM json_each(?)) ' + query,
+                                     self.connection, params=(ids,))
+
+    def missingGames(self, game_ids, partial=False):
+        # partial=True also counts games cached only from the bulk game log as missing
+        complete = ' AND a.PARTIAL IS NULL' if partial and 'PARTIAL' in self.columns() else ''
+        found = self._withGameIds(game_ids, f'SELECT GAME_ID FROM wanted WHERE NOT EXISTS '
+                                            f'(SELECT 1 FROM {self.TABLE} a WHERE a.GAME_ID = wanted.GAME_ID{complete})')
+        missing = set(found['GAME_ID'])
+        return [gid for gid in game_ids if str(gid) in missing]
+
+    def load(self, game_ids=None):
+        if game_ids is None:
+            df = pd.read_sql_query(f'SELECT * FROM {self.TABLE}', self.connection)
+        else:
+            df = self._withGameIds(game_ids, f'SELECT a.* FROM {self.TABLE} a JOIN wanted USING (GAME_ID)')
+        return df.replace({None: np.nan})
+
+    def recordFailure(self, game_id, error, base_delay=30, max_delay=3600):
+        # Each failure doubles the wait before the game is due again: 30s, 1m, 2m ... capped at max_delay
+        with self._lock, self.connection:
+            row = self.connection.execute('SELECT ATTEMPTS FROM failed_games WHERE GAME_ID = ?', (str(game_id),)).fetchone()
+            attempts = (row[0] if row else 0) + 1
+            delay = min(max_delay, base_delay * 2 ** (attempts - 1))
+            self.connection.execute('INSERT OR REPLACE INTO failed_games VALUES (?, ?, ?, ?)',
+                                    (str(game_id), attempts, str(error), time.time() + delay))
+        return delay
+
+    def clearFailures(self, game_ids):
+        with self._lock, self.connection:
+            self.connection.executemany('DELETE FROM failed_games WHERE GAME_ID = ?', ((str(gid),) for gid in game_ids))
+
+    def failedGames(self, due_only=False):
+        query = 'SELECT GAME_ID, ATTEMPTS, LAST_ERROR, NEXT_ATTEMPT FROM failed_games'
+        if due_only:
+            return pd.read_sql_query(query + ' WHERE NEXT_ATTEMPT <= ? ORDER BY GAME_ID', self.connection, params=(time.time(),))
+        return pd.read_sql_query(query + ' ORDER BY GAME_ID', self.connection)
+
+    def nextAttempt(self, game_ids):
+        # Earliest NEXT_ATTEMPT among these queued games (None if none of them are queued)
+        due = self._withGameIds(game_ids, 'SELECT MIN(f.NEXT_ATTEMPT) AS DUE FROM failed_games f JOIN wanted USING (GAME_ID)')
+        return None if due.empty or due['DUE'].isna().all() else float(due['DUE'].iloc[0])
+
+    def close(self):
+        self.connection.close()
+
+def checkConcurrentAccess(directory=None):
+    """
+    Two caches on one file, as when a notebook holds the cache open during a resume:
+    lookups on one must not lock the file against writes from the other.
+    """
+    directory = directory or tempfile.mkdtemp()
+    path = os.path.join(directory, 'ADVANCED_STATS.sqlite')
+    reader, writer = AdvancedStatsCache(path), AdvancedStatsCache(path)
+    try:
+        writer.append(pd.DataFrame({'GAME_ID': ['0022400001'], 'PLAYER_ID': [1], 'PACE': [99.0]}))
+        missing = reader.missingGames(['0022400001', '0022400002'])
+        loaded = reader.load(['0022400001'])
+        writer.append(pd.DataFrame({'GAME_ID': ['0022400002'], 'PLAYER_ID': [2], 'PACE': [97.5]}))
+        writer.recordFailure('0022400003', 'timeout')
+        ok = (missing == ['0022400002'] and len(loaded) == 1 and not reader.connection.in_transaction
+              and reader.missingGames(['0022400002']) == [] and len(reader.failedGames()) == 1)
+    except sqlite3.OperationalError as e:
+        print(f"[ERROR] {e}")
+        ok = False
+    finally:
+        reader.close()
+        writer.close()
+    print("Concurrent access check passed" if ok else "Concurrent access check FAILED")
+    return ok
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Advanced-stats cache maintenance')
+    parser.add_argument('command', choices=['check'])
+    args = parser.parse_args()
+    raise SystemExit(0 if checkConcurrentAccess() else 1)
@@ -0,0 +1,123 @@
+"""
+Closing line value for our picks against the odds snapshot history.
+
+    from NBAData.clv import load_pair_picks, closing_line_value, summarize_clv
+    from NBAData.historicalOddsStore import load_historical_odds
+
+    picks = load_pair_picks()
+    clv = closing_line_value(picks, load_historical_odds(bookmakers=['PrizePicks']))
+    summarize_clv(clv, by='CATEGORY')
+
+The closing line of a pick is the last snapshot strictly before tip-off of the
+same game for the same (player, market, book, side), found with one as-of join
+over everything.
+"""
+import glob
+import os
+import numpy as np
+import pandas as pd
+from NBAData.devig import american_to_decimal
+
+PAIRS_DIRECTORY = 'CSV_FILES/HISTORICAL_PROP_PAIRS'
+KEY_COLUMNS = ['NAME', 'CATEGORY', 'BOOKMAKER', 'OVER/UNDER']
+
+def picks_from_pairs(pairs, game_date, bookmaker='PrizePicks'):
+    """
+    One pick per leg of a prizePicksPairsEV / prizePicksTriosEV table. The leg
+    sides come from TYPE ('OVER/UNDER' -> leg 1 Over, leg 2 Under).
+    """
+    legs = []
+    sides = pairs['TYPE'].str.split('/')
+    leg = 1
+    while f'PLAYER {leg}' in pairs.columns:
+        legs.append(pd.DataFrame({
+            'PICK_ID': pairs.index.astype(str) + f'-{leg}',
+            'GAME_DATE': game_date,
+            'NAME': pairs[f'PLAYER {leg}'],
+            'CATEGORY': pairs[f'CATEGORY {leg}'],
+            'BOOKMAKER': bookmaker,
+            'OVER/UNDER': sides.str[leg - 1].str.capitalize(),
+            'LINE': pairs[f'PLAYER {leg} LINE'].astype(float),
+            'EV': pairs['EV'],
+        }))
+        leg += 1
+    return pd.concat(legs, ignore_index=True) if legs else pd.DataFrame(columns=['PICK_ID', 'GAME_DATE'] + KEY_COLUMNS + ['LINE', 'EV'])
+
+def load_pair_picks(directory=PAIRS_DIRECTORY):
+    # <YYYYMMDD>_PAIRS.csv files written by NBAData/other.process_date_range
+    frames = []
+    for path in sorted(glob.glob(os.path.join(directory, '*_PAIRS.csv'))):
+        stamp = os.path.basename(path).split('_')[0]
+        game_date = f"{stamp[:4]}-{stamp[4:6]}-{stamp[6:]}"
+        picks = picks_from_pairs(pd.read_csv(path, index_col=0), game_date)
+        picks['PICK_ID'] = f"{stamp}-" + picks['PICK_ID']
+        frames.append(picks)
+    return pd.concat(frames, ignore_index=True) if frames else picks_from_pairs(pd.DataFrame(columns=['TYPE', 'EV']), None)
+
+def closing_line_value(picks, snapshots):
+    """
+    Per-pick CLV. `picks` needs the KEY_COLUMNS and LINE, and either COMMENCE_TIME
+    or GAME_DATE (tip-off is then looked up in the snapshots); ODDS is optional.
+    `snapshots` is odds history with KEY_COLUMNS, LINE, ODDS, SNAPSHOT_TIME and
+    COMMENCE_TIME, e.g. load_historical_odds().
+
+    LINE CLV is in points, positive when the close moved past our number (up for
+    an Over, down for an Under). PRICE CLV is pick decimal / close decimal - 1,
+    only where the pick carries ODDS and closed at the same line.
+    """
+    snapshots = snapshots.copy()
+    for column in KEY_COLUMNS:
+        snapshots[column] = snapshots[column].astype(str)
+    picks = picks.copy()
+    for column in KEY_COLUMNS:
+        picks[column] = picks[column].astype(str)
+
+    if 'COMMENCE_TIME' not in picks.columns:
+        games = snapshots.assign(GAME_DATE=snapshots['COMMENCE_TIME'].dt.tz_convert('US/Eastern').dt.strftime('%Y-%m-%d'))
+        games = games.drop_duplicates(['NAME', 'GAME_DATE'])[['NAME', 'GAME_DATE', 'COMMENCE_TIME']]
+        picks = picks.merge(games, on=['NAME', 'GAME_DATE'], how='left')
+    if 'ODDS' not in picks.columns:
+        picks['ODDS'] = np.nan
+
+    # The close is looked up within the same game: GAME_START (its commence time) is part of the key,
+    # so a pick never takes the last line of a player's earlier game
+    closes = snapshots[snapshots['SNAPSHOT_TIME'] < snapshots['COMMENCE_TIME']]
+    closes = closes[KEY_COLUMNS + ['COMMENCE_TIME', 'SNAPSHOT_TIME', 'LINE', 'ODDS']].rename(
+        columns={'COMMENCE_TIME': 'GAME_START', 'SNAPSHOT_TIME': 'CLOSE_TIME', 'LINE': 'CLOSE LINE', 'ODDS': 'CLOSE ODDS'})
+    closes['GAME_START'] = closes['GAME_START'].astype(closes['CLOSE_TIME'].dtype)
+    closes = closes.sort_values('CLOSE_TIME', kind='stable').drop_duplicates(KEY_COLUMNS + ['GAME_START', 'CLOSE_TIME'], keep='last')
+
+    unmatched = picks['COMMENCE_TIME'].isna()
+    timed = picks[~unmatched].sort_values('COMMENCE_TIME', kind='stable')
+    timed['COMMENCE_TIME'] = timed['COMMENCE_TIME'].astype(closes['CLOSE_TIME'].dtype)
+    timed['GAME_START'] = timed['COMMENCE_TIME']
+    joined = pd.merge_asof(timed, closes, left_on='COMMENCE_TIME', right_on='CLOSE_TIME', by=KEY_COLUMNS + ['GAME_START'],
+                           direction='backward', allow_exact_matches=False).drop(columns='GAME_START')
+    joined = pd.concat([joined, picks[unmatched]], ignore_index=True)
+
+    direction = np.where(joined['OVER/UNDER'] == 'Under', -1.0, 1.0)
+    joined['LINE CLV'] = (joined['CLOSE LINE'] - joined['LINE']) * direction
+    same_line = joined['CLOSE LINE'] == joined['LINE']
+    price_clv = american_to_decimal(joined['ODDS']) / american_to_decimal(joined['CLOSE ODDS']) - 1
+    joined['PRICE CLV'] = np.where(same_line, price_clv, np.nan)
+    joined['BEAT CLOSE'] = np.where(joined['CLOSE LINE'].isna(), np.nan,
+                                    (joined['LINE CLV'] > 0) | (same_line & (joined['PRICE CLV'] > 0)))
+    return joined
+
+def summarize_clv(clv, by=None):
+    """
+    Aggregate CLV: picks, how many found a closing line, mean line/price CLV and
+    the share that beat the close. `by` is an optional column (or list) to group on.
+    """
+    def summary(group):
+        matched = group['CLOSE LINE'].notna()
+        return pd.Series({
+            'PICKS': len(group),
+            'MATCHED': int(matched.sum()),
+            'MEAN LINE CLV': group.loc[matched, 'LINE CLV'].mean(),
+            'MEAN PRICE CLV': group['PRICE CLV'].mean(),
+            'BEAT CLOSE %': group.loc[matched, 'BEAT CLOSE'].astype(float).mean() * 100,
+        })
+    if by is None:
+        return summary(clv).to_frame().T
+    return clv.groupby(by).apply(summary, include_groups=False).reset_index()
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+from PlayerNames import normalized
+
+# Props are keyed on the normalized player name (KEY) so books that spell a name
+# differently still land in one consensus group; NAME keeps a readable spelling
+PROP_COLUMNS = ['CATEGORY', 'KEY', 'LINE']
+BOOK_COLUMNS = ['BOOKMAKER'] + PROP_COLUMNS
+
+def implied_probability(odds):
+    odds = np.asarray(odds, dtype=float)
+    # np.where evaluates both branches; +100 would divide by zero in the favourite branch
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(odds > 0, 100 / (odds + 100), -odds / (-odds + 100))
+
+def american_to_decimal(odds):
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide='ignore'):
+        return np.where(odds > 0, 1 + odds / 100, 1 + 100 / -odds)
+
+def probability_to_decimal(prob):
+    return 1 / np.asarray(prob, dtype=float)
+
+def probability_to_american(prob):
+    # Same convention as gambling.fairProb: +100 at evens, positive for underdogs
+    decimal = probability_to_decimal(prob)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        american = np.where(decimal >= 2.0, (decimal - 1) * 100, -100 / (decimal - 1))
+    return np.round(american)
+
+def pair_sides(odds):
+    """
+    One row per (book, market, player, line) with the Over and Under price side
+    by side. Props priced on only one side are dropped since they can't be de-vigged.
+    """
+    sides = odds[odds['OVER/UNDER'].isin(['Over', 'Under'])]
+    sides = pd.DataFrame({
+        'BOOKMAKER': sides['BOOKMAKER'].astype(object),
+        'CATEGORY': sides['CATEGORY'].astype(object),
+        'KEY': normalized(sides['NAME']),
+        'NAME': sides['NAME'].astype(object),
+        'LINE': sides['LINE'],
+        'SIDE': sides['OVER/UNDER'].astype(object).str.upper() + ' ODDS',
+        'ODDS': sides['ODDS'].astype(float),
+    }).dropna(subset=['LINE'])
+    sides = sides.drop_duplicates(BOOK_COLUMNS + ['SIDE'], keep='last')
+    paired = sides.pivot(index=BOOK_COLUMNS, columns='SIDE', values='ODDS').reindex(columns=['OVER ODDS', 'UNDER ODDS'])
+    paired = paired.dropna().reset_index().rename_axis(columns=None)
+    names = sides.drop_duplicates('KEY').set_index('KEY')['NAME']
+    paired.insert(3, 'NAME', paired['KEY'].map(names))
+    return paired
+
+def bisect(f, low, high, iterations=60):
+    # Vectorized bisection for a function increasing in its argument, one root per element
+    low, high = np.broadcast_arrays(np.asarray(low, dtype=float), np.asarray(high, dtype=float))
+    low, high = low.copy(), high.copy()
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        above = f(mid) > 0
+        high = np.where(above, mid, high)
+        low = np.where(above, low, mid)
+    return (low + high) / 2
+
+def multiplicative(over, under):
+    total = over + under
+    return over / total, under / total
+
+def additive(over, under):
+    margin = (over + under - 1) / 2
+    return np.clip(over - margin, 0, 1), np.clip(under - margin, 0, 1)
+
+def power(over, under):
+    # over**k + under**k = 1; k > 1 whenever the book has an overround
+    k = bisect(lambda k: 1 - (over ** k + under ** k), np.full_like(over, 0.01), np.full_like(over, 20.0))
+    return over ** k, under ** k
+
+def shin(over, under):
+    # Shin (1993): z is the share of insider money that explains the overround
+    total = over + under
+
+    def fair(z, p):
+        return (np.sqrt(z ** 2 + 4 * (1 - z) * p ** 2 / total) - z) / (2 * (1 - z))
+
+    z = bisect(lambda z: 1 - (fair(z, over) + fair(z, under)), np.zeros_like(over), np.full_like(over, 0.99))
+    z = np.where(total > 1, z, 0)
+    return fair(z, over), fair(z, under)
+
+METHODS = {
+    'multiplicative': multiplicative,
+    'additive': additive,
+    'power': power,
+    'shin': shin,
+}
+
+def devig_books(odds, method='multiplicative'):
+    """
+    Vig-free Over/Under probabilities for every two-sided prop at every book.
+    `odds` is a finder/odds-client frame (BOOKMAKER, CATEGORY, NAME, OVER/UNDER, LINE, ODDS).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown de-vig method {method!r}, expected one of: {', '.join(METHODS)}")
+    books = pair_sides(odds)
+    over = implied_probability(books['OVER ODDS'].to_numpy())
+    under = implied_probability(books['UNDER ODDS'].to_numpy())
+    fair_over, fair_under = METHODS[method](over, under)
+    books['VIG'] = over + under - 1
+    books['FAIR OVER PROB'] = fair_over
+    books['FAIR UNDER PROB'] = fair_under
+    return books
+
+def consensus(books, how='mean'):
+    """
+    Combine the per-book fair probabilities into one price per prop, renormalized so
+    Over + Under = 1, with fair American and decimal odds for both sides.
+    """
+    grouped = books.groupby(PROP_COLUMNS, sort=False)
+    props = grouped[['FAIR OVER PROB', 'FAIR UNDER PROB', 'VIG']].agg(how)
+    props.insert(0, 'NAME', grouped['NAME'].first())
+    props['BOOKS'] = grouped.size()
+    total = props['FAIR OVER PROB'] + props['FAIR UNDER PROB']
+    props['FAIR OVER PROB'] /= total
+    props['FAIR UNDER PROB'] /= total
+    for side in ['OVER', 'UNDER']:
+        props[f'FAIR {side} ODDS'] = probability_to_american(props[f'FAIR {side} PROB'].to_numpy())
+        props[f'FAIR {side} DECIMAL'] = probability_to_decimal(props[f'FAIR {side} PROB'].to_numpy())
+    return props.reset_index()
+
+def devig(odds, method='multiplicative', how='mean'):
+    # Whole board in one call: pair sides per book, de-vig, then take the consensus per prop
+    return consensus(devig_books(odds, method), how)
@@ -2,23 +2,39 @@ import pandas as pd
 import numpy as np
 import time
 import os
+import argparse
 from datetime import datetime
-from nba_api.stats.endpoints import leaguegamelog, boxscoreadvancedv2, teamgamelog
+from nba_api.stats.endpoints import leaguegamelog, boxscoreadvancedv2, teamgamelog, playergamelogs
 from nba_api.stats.static import teams
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from NBAData.advancedStatsCache import AdvancedStatsCache
+from NBAData.rateLimiter import nba_request
+from NBAData.responseCache import RESPONSE_CACHE
+
+def minutesPlayed(minutes):
+    # Box scores give MIN as "MM:SS" (sometimes "MM.000000:SS"), the game logs as decimal minutes;
+    # both become float minutes so the cache column has one type
+    text = minutes.astype(str).str.strip()
+    clock = text.str.extract(r'^(\d+)(?:\.\d+)?:(\d+)$').astype(float)
+    decimal = pd.to_numeric(minutes.where(~text.str.contains(':')), errors='coerce')
+    return (clock[0] + clock[1] / 60).round(2).fillna(decimal)
 
 class FetchPlayersStats:
-    def __init__(self, default_season='2024-25', sleep_time=0.1):
+    def __init__(self, default_season='2024-25', sleep_time=0):
+        # Requests are paced by the shared limiter in NBAData.rateLimiter; sleep_time only adds a fixed extra delay
         self.default_season = default_season
         self.sleep_time = sleep_time
 
     def fetchPlayerStats(self, season=None, season_type='Regular Season'):
         season = season or self.default_season
-        df = leaguegamelog.LeagueGameLog(
+        df = nba_request(
+            leaguegamelog.LeagueGameLog,
             season=season,
             player_or_team_abbreviation='P',
             season_type_all_star=season_type
         ).get_data_frames()[0]
+        # The game log only lists played games, so their box scores can be cached for good
+        RESPONSE_CACHE.markFinal(df['GAME_ID'].unique())
 
         df['OPP_ABBREVIATION'] = df['MATCHUP'].str.extract(r'(?:vs\.|@) ([A-Z]+)')
         df['HOME_GAME'] = df['MATCHUP'].str.contains('vs\.').astype(int)
@@ -37,56 +53,171 @@ class FetchPlayersStats:
         ]
         return df[cols]
 
-    def fetchAdvancedStats(self, game_id, sleep_time=None):
+    def fetchAdvancedStats(self, game_id, sleep_time=None, raise_errors=False):
         sleep_time = sleep_time or self.sleep_time
         try:
-            time.sleep(sleep_time)
-            df = boxscoreadvancedv2.BoxScoreAdvancedV2(game_id=game_id).get_data_frames()[0]
+            if sleep_time:
+                time.sleep(sleep_time)
+            df = nba_request(boxscoreadvancedv2.BoxScoreAdvancedV2, game_id=game_id).get_data_frames()[0]
             return df
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"[ERROR] Game {game_id}: {e}")
             return pd.DataFrame()
 
-    def getAdvancedStats(self, player_data, sleep_time=None, max_workers=None, cache_file ='REGULAR_DATA/ALL_REGULAR_DATA.csv'):
+    def openCache(self, cache_file='REGULAR_DATA/ALL_REGULAR_DATA.csv'):
+        # An old CSV cache path is migrated once into a SQLite file next to it
+        legacy_csv = cache_file if cache_file.endswith('.csv') else None
+        return AdvancedStatsCache(os.path.splitext(cache_file)[0] + '.sqlite', legacy_csv=legacy_csv)
+
+    def flushAdvancedStats(self, cache, buffer, replace=True):
+        # Box scores (replace=True) overwrite any PARTIAL bulk rows for their game
+        if not buffer:
+            return 0
+        df = pd.concat(buffer, ignore_index=True)
+        buffer.clear()
+        if 'MIN' in df.columns:
+            df['MIN'] = minutesPlayed(df['MIN'])
+        added = cache.append(df, replace=replace)
+        cache.clearFailures(df['GAME_ID'].astype(str).unique())
+        return added
+
+    def fetchAdvancedGames(self, cache, game_ids, sleep_time=None, max_workers=None, flush_every=25, max_retries=3, base_delay=30):
+        # Box scores are written to the cache every `flush_every` games, so an interrupted run
+        # keeps its work. Failures go to the cache's failed-game queue, whose NEXT_ATTEMPT backoff
+        # also times the in-run retry rounds; whatever still fails stays queued for `resume`.
         sleep_time = sleep_time or self.sleep_time
         max_workers = max_workers or min(10, os.cpu_count() or 4)
-        game_ids = player_data['GAME_ID'].unique()
-        
-        if os.path.exists(cache_file):
-            cached_df = pd.read_csv(cache_file, dtype={'GAME_ID': str})
-            cached_game_ids = cached_df['GAME_ID'].unique()
-        else:
-            cached_df = pd.DataFrame()
-            cached_game_ids = []
-
-        missing_ids = [gid for gid in game_ids if gid not in cached_game_ids]
-        print(f"Total games: {len(game_ids)}, Cached: {len(cached_game_ids)}, To fetch: {len(missing_ids)}")
+        pending = list(game_ids)
+        for attempt in range(max_retries + 1):
+            if attempt:
+                due = cache.nextAttempt(pending)
+                delay = max(0.0, due - time.time()) if due is not None else 0.0
+                print(f"Retrying {len(pending)} failed games in {delay:.0f}s (attempt {attempt}/{max_retries})")
+                time.sleep(delay)
+            buffer, failed = [], []
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {executor.submit(self.fetchAdvancedStats, gid, sleep_time, True): gid for gid in pending}
+                    for i, future in enumerate(as_completed(futures)):
+                        gid = futures[future]
+                        try:
+                            df = future.result()
+                            if df.empty:
+                                raise ValueError("empty box score")
+                            buffer.append(df)
+                            print(f"[{i+1}/{len(pending)}] Fetched {gid}")
+                        except Exception as e:
+                            failed.append(gid)
+                            cache.recordFailure(gid, e, base_delay)
+                            print(f"[ERROR] Fetching game {gid}: {e}")
+                        if len(buffer) >= flush_every:
+                            self.flushAdvancedStats(cache, buffer)
+            finally:
+                self.flushAdvancedStats(cache, buffer)
+            pending = failed
+            if not pending:
+                break
+        if pending:
+            print(f"{len(pending)} games still failing, queued for: python -m NBAData.fetchPlayersStats resume")
+        return pending
+
+    def fetchBulkAdvancedStats(self, season=None, season_type='Regular Season', date_from=None, date_to=None):
+        # Advanced player lines for a whole season (or date range) from one PlayerGameLogs request,
+        # in BoxScoreAdvancedV2's layout. The game log has no START_POSITION/COMMENT, and only lists
+        # players who got on the floor, so its rows are cached as PARTIAL for box scores to replace.
+        season = season or self.default_season
+        df = nba_request(
+            playergamelogs.PlayerGameLogs,
+            season_nullable=season,
+            season_type_nullable=season_type,
+            measure_type_player_game_logs_nullable='Advanced',
+            date_from_nullable=date_from or '',
+            date_to_nullable=date_to or '',
+        ).get_data_frames()[0]
+
+        df = df.rename(columns={'AST_TO': 'AST_TOV'})
+        df['GAME_ID'] = df['GAME_ID'].astype(str)
+        df['START_POSITION'] = np.nan
+        df['COMMENT'] = np.nan
+        df['PARTIAL'] = 1
+        box_cols = [
+            'GAME_ID', 'TEAM_ID', 'TEAM_ABBREVIATION', 'PLAYER_ID', 'PLAYER_NAME', 'NICKNAME', 'START_POSITION', 'COMMENT',
+            'MIN', 'E_OFF_RATING', 'OFF_RATING', 'E_DEF_RATING', 'DEF_RATING', 'E_NET_RATING', 'NET_RATING', 'AST_PCT',
+            'AST_TOV', 'AST_RATIO', 'OREB_PCT', 'DREB_PCT', 'REB_PCT', 'TM_TOV_PCT', 'EFG_PCT', 'TS_PCT', 'USG_PCT',
+            'E_USG_PCT', 'E_PACE', 'PACE', 'PACE_PER40', 'POSS', 'PIE', 'PARTIAL',
+        ]
+        return df[[c for c in box_cols if c in df.columns]]
+
+    def getAdvancedStats(self, player_data, sleep_time=None, max_workers=None, cache_file ='REGULAR_DATA/ALL_REGULAR_DATA.csv',
+                         bulk=False, season=None, season_type='Regular Season', flush_every=25, max_retries=0):
+        # bulk=True fills missing games from one PlayerGameLogs request; those rows have no
+        # START_POSITION/COMMENT and count as cached until a bulk=False run replaces them with box scores
+        game_ids = player_data['GAME_ID'].astype(str).unique()
+
+        cache = self.openCache(cache_file)
+        try:
+            missing_ids = cache.missingGames(game_ids, partial=not bulk)
+            print(f"Total games: {len(game_ids)}, Cached: {len(game_ids) - len(missing_ids)}, To fetch: {len(missing_ids)}")
         
-        new_stats = []
-        if missing_ids:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {executor.submit(self.fetchAdvancedStats, gid, sleep_time): gid for gid in missing_ids}
-                for i, future in enumerate(as_completed(futures)):
-                    gid = futures[future]
-                    try:
-                        df = future.result()
-                        if not df.empty:
-                            new_stats.append(df)
-                        print(f"[{i+1}/{len(missing_ids)}] Fetched {gid}")
-                    except Exception as e:
-                        print(f"[ERROR] Fetching game {gid}: {e}")
-
-        # Combine cached + new
-        if new_stats:
-            new_df = pd.concat(new_stats, ignore_index=True)
-            combined = pd.concat([cached_df, new_df], ignore_index=True)
-            combined.drop_duplicates(subset=['GAME_ID', 'PLAYER_ID'], inplace=True)
-            combined.to_csv(cache_file, index=False)
-        else:
-            combined = cached_df
+            if missing_ids and bulk:
+                # One league-level request for the dates still missing; box scores only fill the gaps
+                try:
+                    # Narrowed to the missing games' dates when the frame has them, else the whole season
+                    date_from = date_to = None
+                    if 'GAME_DATE' in player_data.columns:
+                        dates = pd.to_datetime(player_data.loc[player_data['GAME_ID'].astype(str).isin(missing_ids), 'GAME_DATE'])
+                        date_from, date_to = dates.min().strftime('%m/%d/%Y'), dates.max().strftime('%m/%d/%Y')
+                    bulk_df = self.fetchBulkAdvancedStats(season, season_type, date_from, date_to)
+                    bulk_df = bulk_df[bulk_df['GAME_ID'].isin(missing_ids)]
+                    self.flushAdvancedStats(cache, [bulk_df], replace=False)
+                    found = set(bulk_df['GAME_ID'])
+                    missing_ids = [gid for gid in missing_ids if gid not in found]
+                    print(f"Bulk advanced stats: {len(found)} games, falling back to box scores for {len(missing_ids)}")
+                except Exception as e:
+                    print(f"[ERROR] Bulk advanced stats: {e}")
+
+            if missing_ids:
+                self.fetchAdvancedGames(cache, missing_ids, sleep_time, max_workers, flush_every, max_retries)
 
+            # Everything fetched is already in the cache; hand back the rows for these games
+            combined = cache.load(game_ids)
+        finally:
+            cache.close()
+        # Rows cached before MIN was normalized may still hold "MM:SS" text
+        if 'MIN' in combined.columns:
+            combined['MIN'] = minutesPlayed(combined['MIN'])
         return combined
 
+    def resumeAdvancedStats(self, cache_file='REGULAR_DATA/ALL_REGULAR_DATA.csv', sleep_time=None, max_workers=None,
+                            due_only=False, flush_every=25, max_retries=3):
+        # Retry the games still sitting in the failed-game queue from earlier runs
+        cache = self.openCache(cache_file)
+        try:
+            queued = cache.failedGames(due_only)['GAME_ID'].tolist()
+            if not queued:
+                print("No failed games queued")
+                return []
+            # Start when the earliest queued game's backoff has run out
+            delay = max(0.0, cache.nextAttempt(queued) - time.time())
+            print(f"Resuming {len(queued)} failed games in {delay:.0f}s")
+            time.sleep(delay)
+            return self.fetchAdvancedGames(cache, queued, sleep_time, max_workers, flush_every, max_retries)
+        finally:
+            cache.close()
+
+    def backfillAdvancedStats(self, seasons, season_type='Regular Season', sleep_time=None, max_workers=None,
+                              cache_file='REGULAR_DATA/ALL_REGULAR_DATA.csv', flush_every=25, max_retries=3):
+        # Games already cached are skipped, so re-running after a crash picks up where it stopped.
+        # Seasons run without waiting on retries; the failed-game queue is worked off once at the end.
+        for season in seasons:
+            print(f"Backfilling advanced stats for {season} {season_type}")
+            player_stats = self.fetchPlayerStats(season, season_type)
+            self.getAdvancedStats(player_stats, sleep_time, max_workers, cache_file, season=season,
+                                  season_type=season_type, flush_every=flush_every, max_retries=0)
+        return self.resumeAdvancedStats(cache_file, sleep_time, max_workers, flush_every=flush_every, max_retries=max_retries)
+
     def mergeData(self, player_data, advanced_stats):
         player_data['GAME_ID'] = player_data['GAME_ID'].astype(str)
         advanced_stats['GAME_ID'] = advanced_stats['GAME_ID'].astype(str)
@@ -99,15 +230,20 @@ class FetchPlayersStats:
         ]
         return pd.merge(player_data, advanced_stats[adv_cols], on=['GAME_ID', 'PLAYER_ID'], how='left')
 
-    def getTeamData(self, season=None, season_type='Regular Season'):
+    def getTeamData(self, season=None, season_type='Regular Season', league_wide=True):
         season = season or self.default_season
+        if league_wide:
+            try:
+                return self.getLeagueTeamData(season, season_type)
+            except Exception as e:
+                print(f"[ERROR] League team game log: {e}, falling back to per-team requests")
         teams_list = teams.get_teams()
         team_data = []
 
         for i, team in enumerate(teams_list):
             try:
                 print(f"[{i+1}/{len(teams_list)}] Fetching data for {team['full_name']}")
-                df = teamgamelog.TeamGameLog(team_id=team['id'], season=season, season_type_all_star=season_type).get_data_frames()[0]
+                df = nba_request(teamgamelog.TeamGameLog, team_id=team['id'], season=season, season_type_all_star=season_type).get_data_frames()[0]
                 df.columns = df.columns.str.upper()
                 drop_cols = ['MATCHUP', 'WL', 'W', 'L', 'W_PCT', 'GAMEDATE']
                 df.drop(columns=[c for c in drop_cols if c in df], inplace=True, errors='ignore')
@@ -118,53 +254,64 @@ class FetchPlayersStats:
 
         return pd.concat(team_data, ignore_index=True) if team_data else pd.DataFrame()
 
-    def addOpponentStats(self, df):
-        def calc(group):
-            if len(group) != 2:
-                return group
-            t1, t2 = group.iloc[0], group.iloc[1]
+    def getLeagueTeamData(self, season=None, season_type='Regular Season'):
+        # Every team's game log in one LeagueGameLog request, reshaped to TeamGameLog's columns
+        season = season or self.default_season
+        print(f"Fetching league team game log for {season}")
+        df = nba_request(
+            leaguegamelog.LeagueGameLog,
+            season=season,
+            player_or_team_abbreviation='T',
+            season_type_all_star=season_type
+        ).get_data_frames()[0]
+        RESPONSE_CACHE.markFinal(df['GAME_ID'].unique())
+
+        # TeamGameLog dates look like 'OCT 22, 2024'
+        df['GAME_DATE'] = pd.to_datetime(df['GAME_DATE']).dt.strftime('%b %d, %Y').str.upper()
+        stat_cols = [
+            'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT',
+            'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PTS',
+        ]
+        df = df[['TEAM_ID', 'GAME_ID', 'GAME_DATE'] + stat_cols]
+        return df.rename(columns={col: f'TEAM_{col}' for col in df.columns if col not in ['GAME_ID', 'TEAM_ID']}).reset_index(drop=True)
 
-            defrtg_1 = (t2['TEAM_PTS'] / (t2['TEAM_FGA'] + 0.44 * t2['TEAM_FTA'] - t2['TEAM_OREB'] + t2['TEAM_TOV'])) * 100
-            defrtg_2 = (t1['TEAM_PTS'] / (t1['TEAM_FGA'] + 0.44 * t1['TEAM_FTA'] - t1['TEAM_OREB'] + t1['TEAM_TOV'])) * 100
+    def addTeamGameStats(self, df):
+        # Self-join every team row to its opponent's row on GAME_ID, then the opponent box
+        # stats, ratings and pace are column arithmetic. Games without exactly two rows get NaN.
+        df = df.copy()
+        df['_POSS'] = df['TEAM_FGA'] + 0.44 * df['TEAM_FTA'] - df['TEAM_OREB'] + df['TEAM_TOV']
+        paired = df.groupby('GAME_ID')['GAME_ID'].transform('size') == 2
 
-            group.loc[group.index[0], ['OPP_DEF_RATING', 'OPP_STL', 'OPP_BLK', 'OPP_REB', 'OPP_FG_PCT', 'OPP_TEAM_ID']] = [
-                defrtg_2, t2['TEAM_STL'], t2['TEAM_BLK'], t2['TEAM_OREB'] + t2['TEAM_DREB'], t2['TEAM_FGM'] / t2['TEAM_FGA'], t2['TEAM_ID']
-            ]
-            group.loc[group.index[1], ['OPP_DEF_RATING', 'OPP_STL', 'OPP_BLK', 'OPP_REB', 'OPP_FG_PCT', 'OPP_TEAM_ID']] = [
-                defrtg_1, t1['TEAM_STL'], t1['TEAM_BLK'], t1['TEAM_OREB'] + t1['TEAM_DREB'], t1['TEAM_FGM'] / t1['TEAM_FGA'], t1['TEAM_ID']
-            ]
-            return group
+        side = df.loc[paired, ['GAME_ID', 'TEAM_ID', 'TEAM_PTS', 'TEAM_STL', 'TEAM_BLK', 'TEAM_OREB', 'TEAM_DREB',
+                               'TEAM_FGM', 'TEAM_FGA', '_POSS']]
+        games = side[['GAME_ID', 'TEAM_ID']].reset_index().merge(side, on='GAME_ID', suffixes=('', '_OPP'))
+        opp = games[games['TEAM_ID'] != games['TEAM_ID_OPP']].set_index('index').reindex(df.index)
 
-        return df.groupby('GAME_ID', group_keys=False).apply(calc)
+        own_poss = df['_POSS'].where(paired)
+        own_rating = df['TEAM_PTS'].where(paired) / own_poss * 100
+        # The opponent's defensive rating is what this team scored per 100 of its possessions
+        df['OPP_DEF_RATING'] = own_rating
+        df['OPP_STL'] = opp['TEAM_STL']
+        df['OPP_BLK'] = opp['TEAM_BLK']
+        df['OPP_REB'] = opp['TEAM_OREB'] + opp['TEAM_DREB']
+        df['OPP_FG_PCT'] = opp['TEAM_FGM'] / opp['TEAM_FGA']
+        df['OPP_TEAM_ID'] = opp['TEAM_ID_OPP']
+        df['TEAM_OFF_RATING'] = own_rating
+        df['TEAM_PACE'] = own_poss
+        df['GAME_PACE'] = (own_poss + opp['_POSS']) / 2
+        df['OPP_PACE'] = opp['_POSS']
+        return df.drop(columns='_POSS')
+
+    # The three per-game passes below used to be separate groupby.apply calls;
+    # they now all go through the single self-join above
+    def addOpponentStats(self, df):
+        return self.addTeamGameStats(df)
 
     def addOffensiveRating(self, df):
-        def calc(group):
-            if len(group) != 2:
-                return group
-            t1, t2 = group.iloc[0], group.iloc[1]
-            pos1 = t1['TEAM_FGA'] + 0.44 * t1['TEAM_FTA'] - t1['TEAM_OREB'] + t1['TEAM_TOV']
-            pos2 = t2['TEAM_FGA'] + 0.44 * t2['TEAM_FTA'] - t2['TEAM_OREB'] + t2['TEAM_TOV']
-            off1 = (t1['TEAM_PTS'] / pos1) * 100
-            off2 = (t2['TEAM_PTS'] / pos2) * 100
-            group.loc[group.index[0], 'TEAM_OFF_RATING'] = off1
-            group.loc[group.index[1], 'TEAM_OFF_RATING'] = off2
-            return group
-
-        return df.groupby('GAME_ID', group_keys=False).apply(calc)
+        return self.addTeamGameStats(df)
 
     def add_pace_stats(self, df):
-        def calc(group):
-            if len(group) != 2:
-                return group
-            t1, t2 = group.iloc[0], group.iloc[1]
-            pos1 = t1['TEAM_FGA'] + 0.44 * t1['TEAM_FTA'] - t1['TEAM_OREB'] + t1['TEAM_TOV']
-            pos2 = t2['TEAM_FGA'] + 0.44 * t2['TEAM_FTA'] - t2['TEAM_OREB'] + t2['TEAM_TOV']
-            avg_pos = (pos1 + pos2) / 2
-            group.loc[group.index[0], ['TEAM_PACE', 'GAME_PACE', 'OPP_PACE']] = [pos1, avg_pos, pos2]
-            group.loc[group.index[1], ['TEAM_PACE', 'GAME_PACE', 'OPP_PACE']] = [pos2, avg_pos, pos1]
-            return group
-
-        return df.groupby('GAME_ID', group_keys=False).apply(calc)
+        return self.addTeamGameStats(df)
 
     def mergeWithTeam(self, player_data, team_data):
         return pd.merge(player_data, team_data, on=['GAME_ID', 'TEAM_ID'], how='left')
@@ -175,18 +322,36 @@ class FetchPlayersStats:
         player_stats = self.fetchPlayerStats(season, season_type)
 
         print("[2] Fetching advanced player stats...")
-        adv_stats = self.getAdvancedStats(player_stats, sleep_time, max_workers, cache_file)
+        adv_stats = self.getAdvancedStats(player_stats, sleep_time, max_workers, cache_file, season=season, season_type=season_type)
 
         print("[3] Merging player data...")
         merged_player_stats = self.mergeData(player_stats, adv_stats)
 
         print("[4] Fetching and processing team data...")
         team_data = self.getTeamData(season, season_type)
-        team_data = self.addOpponentStats(team_data)
-        team_data = self.addOffensiveRating(team_data)
-        team_data = self.add_pace_stats(team_data)
+        team_data = self.addTeamGameStats(team_data)
 
         print("[5] Final player-team merge...")
         complete_stats = self.mergeWithTeam(merged_player_stats, team_data)
         print("✅ Complete stats processing finished.")
         return complete_stats
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Backfill the advanced-stats cache')
+    parser.add_argument('command', choices=['backfill', 'resume'])
+    parser.add_argument('--seasons', nargs='+', default=['2024-25'], help="e.g. 2022-23 2023-24")
+    parser.add_argument('--season-type', default='Regular Season')
+    parser.add_argument('--cache-file', default='REGULAR_DATA/ALL_REGULAR_DATA.csv')
+    parser.add_argument('--max-workers', type=int, default=None)
+    parser.add_argument('--flush-every', type=int, default=25, help='games per cache write')
+    parser.add_argument('--max-retries', type=int, default=3, help='backoff rounds for failed games')
+    parser.add_argument('--due-only', action='store_true', help='resume: only games whose backoff has elapsed')
+    args = parser.parse_args()
+
+    fetcher = FetchPlayersStats()
+    if args.command == 'backfill':
+        fetcher.backfillAdvancedStats(args.seasons, args.season_type, max_workers=args.max_workers, cache_file=args.cache_file,
+                                      flush_every=args.flush_every, max_retries=args.max_retries)
+    else:
+        fetcher.resumeAdvancedStats(args.cache_file, max_workers=args.max_workers, due_only=args.due_only,
+                                    flush_every=args.flush_every, max_retries=args.max_retries)
@@ -27,33 +27,38 @@ def kelly_criterion(probability, payout, stake, kelly_fraction=1.0):
     return max(0, round(kelly * kelly_fraction, 4))
 
 
+class OddsIndex():
+    """
+    Book prices keyed by (NAME, CATEGORY, LINE, OVER/UNDER), built once per odds snapshot
+    so every fair-odds lookup on the board is a dict hit instead of a scan of the frame.
+    """
+    KEY_COLUMNS = ['NAME', 'CATEGORY', 'LINE', 'OVER/UNDER']
+
+    def __init__(self, bookmakersData):
+        odds = bookmakersData['ODDS'].to_numpy()
+        # Lines without a number (yes/no markets) can never match a prop line, so they are left out
+        groups = bookmakersData.groupby(self.KEY_COLUMNS, observed=True, sort=False).indices
+        self.prices = {(name, category, float(line), side): odds[rows]
+                       for (name, category, line, side), rows in groups.items()}
+
+    def get(self, name, category, line, over_under):
+        return self.prices.get((name, category, float(line), over_under), np.empty(0))
+
 def fairProb(bookmakersData, name, line, category, over_under, fixed_buffer=0.035):
-    df = bookmakersData[
-        (bookmakersData['NAME'] == name) &
-        (bookmakersData['CATEGORY'] == category)
-    ]
-    
-    grouped_df = df.groupby('LINE').agg({
-        'BOOKMAKER': list,  # Collect all bookmakers offering the same line
-        'ODDS': list,
-        'OVER/UNDER': list
-    }).reset_index() 
-
-    res = []
-    for idx, row in grouped_df.iterrows():
-        if line == row['LINE']:
-            for odds, OU in zip(row['ODDS'], row['OVER/UNDER']):
-                if OU == over_under:
-                    res.append(round(impliedProb(odds), 2))
-    
+    # bookmakersData may be an OddsIndex; pass one when pricing many props from the same frame
+    index = bookmakersData if isinstance(bookmakersData, OddsIndex) else OddsIndex(
+        bookmakersData[(bookmakersData['NAME'] == name) & (bookmakersData['CATEGORY'] == category)])
+    odds = index.get(name, category, line, over_under)
+
     # Apply a fixed buffer for one-sided props
-    adjusted_probs = [prob - fixed_buffer for prob in res]
+    implied = np.where(odds > 0, 100 / (odds + 100), np.abs(odds) / (np.abs(odds) + 100))
+    adjusted_probs = np.round(implied, 2) - fixed_buffer
 
     # Calculate the fair odds
     if len(adjusted_probs) == 0:
         raise ValueError("No valid probabilities found for the given line and over/under condition.")
     
-    fair_odds = sum(adjusted_probs) / len(adjusted_probs)
+    fair_odds = adjusted_probs.sum() / len(adjusted_probs)
     
     if fair_odds == 0:
         raise ValueError("Calculated fair probability is zero, cannot convert to odds.")
@@ -143,6 +148,7 @@ def monte_carlo_prop_simulation(player_df, modelPred, prop_line, std_dev, num_si
 def single_bet(data, bookmakers, models, games, category='player_points', stat_line='PTS', current_dataset=None):  
     print("Processing single bets...")
     Props = bookmakers[['NAME', 'BOOKMAKER', 'CATEGORY', 'LINE', 'OVER/UNDER', 'ODDS']].loc[bookmakers['CATEGORY'] == category]
+    odds_index = OddsIndex(Props)
     results = []
     model = models[stat_line]
     
@@ -232,7 +238,7 @@ def single_bet(data, bookmakers, models, games, category='player_points', stat_l
 
             # Calculate fair odds
             try:
-                fair_odds = fairProb(bookmakers, name, line, category, over_under)
+                fair_odds = fairProb(odds_index, name, line, category, over_under)
             except ValueError as e:
                 fair_odds = None
 
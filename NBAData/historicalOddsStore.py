@@ -0,0 +1,216 @@
+"""
+Compacts the per-day CSVs in CSV_FILES/HISTORICAL_ODDS into one Parquet dataset
+partitioned by GAME_DATE, and loads it back with date/book/market filters.
+
+    python -m NBAData.historicalOddsStore ingest
+    python -m NBAData.historicalOddsStore ingest --rebuild
+
+Ingestion is incremental: a manifest records each CSV's size, mtime and the
+GAME_DATE partitions it feeds, so only new or changed files are read, and only
+the partitions they touch are rewritten. A partition a changed or deleted file
+fed is rebuilt from its files rather than appended to, so a file's old rows
+never stay behind. Each file is one snapshot, stored as SNAPSHOT_TIME.
+historicalOdds.ipynb queries the API at SNAPSHOT_HOUR UTC of the file's date,
+but many files hold games that tipped before that hour, so the snapshot time
+is capped just before the file's earliest COMMENCE_TIME. A row that repeats
+the previous snapshot's line and price for the same prop is dropped, so the
+store is the line-movement history of every prop. A store whose manifest
+predates the partition lists (and the cap) is rebuilt on the next ingest.
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+SOURCE_DIRECTORY = 'CSV_FILES/HISTORICAL_ODDS'
+STORE_DIRECTORY = 'CSV_FILES/HISTORICAL_ODDS_STORE'
+MANIFEST = '_manifest.json'
+
+# Daily CSV header -> the upper-case names the rest of the pipeline uses
+COLUMNS = {
+    'player': 'NAME',
+    'market': 'CATEGORY',
+    'bookmaker': 'BOOKMAKER',
+    'side': 'OVER/UNDER',
+    'line': 'LINE',
+    'price': 'ODDS',
+    'home_team': 'HOME_TEAM',
+    'away_team': 'AWAY_TEAM',
+    'game_id': 'GAME_ID',
+    'commence_time': 'COMMENCE_TIME',
+}
+DICTIONARY_COLUMNS = ['NAME', 'CATEGORY', 'BOOKMAKER', 'OVER/UNDER', 'HOME_TEAM', 'AWAY_TEAM', 'GAME_ID']
+SCHEMA = pa.schema(
+    [pa.field(column, pa.dictionary(pa.int32(), pa.string())) for column in ['NAME', 'CATEGORY', 'BOOKMAKER', 'OVER/UNDER']]
+    + [pa.field('LINE', pa.float64()), pa.field('ODDS', pa.int64())]
+    + [pa.field(column, pa.dictionary(pa.int32(), pa.string())) for column in ['HOME_TEAM', 'AWAY_TEAM', 'GAME_ID']]
+    + [pa.field('COMMENCE_TIME', pa.timestamp('us', tz='UTC')), pa.field('SNAPSHOT_TIME', pa.timestamp('us', tz='UTC'))]
+)
+PROP_KEY = ['GAME_ID', 'NAME', 'CATEGORY', 'BOOKMAKER', 'OVER/UNDER']
+PARTITIONING = ds.partitioning(pa.schema([('GAME_DATE', pa.string())]), flavor='hive')
+
+# Hour (UTC) historicalOdds.ipynb asks the API for, 5 PM ET
+SNAPSHOT_HOUR = 21
+# How far before the earliest tip-off a capped snapshot is placed, so it still counts as pre-game
+SNAPSHOT_MARGIN = pd.Timedelta(minutes=1)
+
+def snapshot_time(path, commence_times=None, hour=SNAPSHOT_HOUR):
+    # MM_DD_YYYY.csv asks for `hour` UTC that day, but a snapshot can't postdate the games it prices
+    nominal = pd.to_datetime(os.path.splitext(os.path.basename(path))[0], format='%m_%d_%Y').tz_localize('UTC') + pd.Timedelta(hours=hour)
+    if commence_times is None or commence_times.isna().all():
+        return nominal
+    return min(nominal, commence_times.min() - SNAPSHOT_MARGIN)
+
+def read_daily_csv(path):
+    df = pd.read_csv(path, dtype={'game_id': str}).rename(columns=COLUMNS)
+    df['COMMENCE_TIME'] = pd.to_datetime(df['COMMENCE_TIME'], utc=True)
+    df['SNAPSHOT_TIME'] = snapshot_time(path, df['COMMENCE_TIME'])
+    # The NBA slate date is the US Eastern date of tip-off, the same date ESPN uses
+    df['GAME_DATE'] = df['COMMENCE_TIME'].dt.tz_convert('US/Eastern').dt.strftime('%Y-%m-%d')
+    return df
+
+def load_manifest(store):
+    try:
+        with open(os.path.join(store, MANIFEST), 'r') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+def save_manifest(store, manifest):
+    path = os.path.join(store, MANIFEST)
+    with open(f"{path}.tmp", 'w') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+def partition_path(store, game_date):
+    return os.path.join(store, f"GAME_DATE={game_date}", 'part-0.parquet')
+
+def write_partition(store, game_date, rows, replace=False):
+    # replace=True writes `rows` as the whole partition instead of adding to what is stored
+    path = partition_path(store, game_date)
+    if rows.empty:
+        if replace and os.path.exists(path):
+            shutil.rmtree(os.path.dirname(path))
+        return 0
+    if os.path.exists(path) and not replace:
+        rows = pd.concat([pq.read_table(path).to_pandas(), rows], ignore_index=True)
+    for column in DICTIONARY_COLUMNS:
+        rows[column] = rows[column].astype(str)
+    rows = rows.sort_values(PROP_KEY + ['SNAPSHOT_TIME'], kind='stable', ignore_index=True)
+    previous = rows.groupby(PROP_KEY, sort=False)[['LINE', 'ODDS']].shift()
+    same_line = rows['LINE'].eq(previous['LINE']) | (rows['LINE'].isna() & previous['LINE'].isna() & previous['ODDS'].notna())
+    rows = rows[~(same_line & rows['ODDS'].eq(previous['ODDS']))]
+    table = pa.Table.from_pandas(rows[SCHEMA.names], schema=SCHEMA, preserve_index=False)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(table, f"{path}.tmp", compression='zstd')
+    os.replace(f"{path}.tmp", path)
+    return len(rows)
+
+def ingest(source=SOURCE_DIRECTORY, store=STORE_DIRECTORY, rebuild=False):
+    """
+    Fold new or changed daily CSVs into the store. Returns the files ingested.
+
+    New files are added to their partitions. Every partition a changed or deleted
+    file touched (before or now) is rebuilt from the files that feed it, so a
+    file's old rows never linger next to its new ones.
+    """
+    manifest = load_manifest(store)
+    if manifest and any('partitions' not in entry for entry in manifest.values()):
+        print("Historical odds store predates per-file partitions, rebuilding it")
+        rebuild = True
+    if rebuild and os.path.isdir(store):
+        shutil.rmtree(store)
+        manifest = {}
+    os.makedirs(store, exist_ok=True)
+
+    paths = {os.path.basename(path): path for path in sorted(glob.glob(os.path.join(source, '*.csv')))}
+    paths.pop('ALL_HISTORICAL_ODDS.csv', None)
+    pending = []
+    for name, path in paths.items():
+        stat = os.stat(path)
+        entry = {'size': stat.st_size, 'mtime': stat.st_mtime}
+        if {key: manifest.get(name, {}).get(key) for key in entry} != entry:
+            pending.append((name, path, entry))
+    removed = [name for name in manifest if name not in paths]
+    if not pending and not removed:
+        print("Historical odds store is up to date")
+        return []
+
+    # Partitions the changed/removed files used to feed have to be rebuilt, not appended to
+    stale = {date for name, _, _ in pending if name in manifest for date in manifest[name]['partitions']}
+    stale |= {date for name in removed for date in manifest[name]['partitions']}
+    for name in removed:
+        del manifest[name]
+
+    frames = {}
+    for name, path, entry in pending:
+        df = read_daily_csv(path)
+        frames[name] = df
+        if name in manifest:
+            stale |= set(df['GAME_DATE'])
+        manifest[name] = dict(entry, rows=len(df), partitions=sorted(df['GAME_DATE'].unique()))
+    # A rebuilt partition also needs the unchanged files that feed it
+    for name, entry in manifest.items():
+        if name not in frames and stale.intersection(entry['partitions']):
+            frames[name] = read_daily_csv(paths[name])
+    new_rows = pd.concat([df.assign(SOURCE=name) for name, df in frames.items()], ignore_index=True) if frames else \
+        pd.DataFrame(columns=SCHEMA.names + ['GAME_DATE', 'SOURCE'])
+    ingested = {name for name, _, _ in pending}
+
+    for game_date in sorted(set(new_rows['GAME_DATE']) | stale):
+        rows = new_rows[new_rows['GAME_DATE'] == game_date]
+        if game_date not in stale:
+            # Appending: the unchanged files' rows here are already stored
+            rows = rows[rows['SOURCE'].isin(ingested)]
+            if rows.empty:
+                continue
+        total = write_partition(store, game_date, rows.drop(columns=['GAME_DATE', 'SOURCE']), replace=game_date in stale)
+        print(f"{game_date}: {total} rows")
+    save_manifest(store, manifest)
+    print(f"Ingested {len(pending)} file(s), removed {len(removed)}")
+    return [name for name, _, _ in pending]
+
+def load_historical_odds(date=None, start=None, end=None, bookmakers=None, markets=None, players=None,
+                         columns=None, store=STORE_DIRECTORY):
+    """
+    Historical odds for one GAME_DATE or an inclusive start/end range ('YYYY-MM-DD'),
+    optionally limited to some bookmakers, markets (CATEGORY) and players (NAME).
+    Partitions outside the dates are never opened; the other filters are pushed
+    down to the Parquet scan.
+    """
+    if not os.path.isdir(store):
+        print(f"No historical odds store at {store}, run: python -m NBAData.historicalOddsStore ingest")
+        return pd.DataFrame(columns=columns or SCHEMA.names + ['GAME_DATE'])
+    dataset = ds.dataset(store, format='parquet', partitioning=PARTITIONING)
+
+    filters = []
+    if date is not None:
+        filters.append(ds.field('GAME_DATE') == str(date))
+    if start is not None:
+        filters.append(ds.field('GAME_DATE') >= str(start))
+    if end is not None:
+        filters.append(ds.field('GAME_DATE') <= str(end))
+    if bookmakers is not None:
+        filters.append(ds.field('BOOKMAKER').isin(list(bookmakers)))
+    if markets is not None:
+        filters.append(ds.field('CATEGORY').isin(list(markets)))
+    if players is not None:
+        filters.append(ds.field('NAME').isin(list(players)))
+    expression = None
+    for condition in filters:
+        expression = condition if expression is None else expression & condition
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compact the daily historical odds CSVs into a Parquet store')
+    parser.add_argument('command', choices=['ingest'])
+    parser.add_argument('--source', default=SOURCE_DIRECTORY)
+    parser.add_argument('--store', default=STORE_DIRECTORY)
+    parser.add_argument('--rebuild', action='store_true', help='drop the store and ingest every CSV again')
+    args = parser.parse_args()
+    ingest(args.source, args.store, args.rebuild)
@@ -1,8 +1,9 @@
 #grabbing play by play data
 import re
 from nba_api.stats.endpoints import PlayByPlayV2
+from NBAData.rateLimiter import nba_request
 def PlayByPlayOrangized(game_id):
-    df = PlayByPlayV2(game_id=game_id).get_data_frames()[0]
+    df = nba_request(PlayByPlayV2, game_id=game_id).get_data_frames()[0]
     df['DESCRIPTION'] = df['HOMEDESCRIPTION'].fillna(df['VISITORDESCRIPTION'])
     df['DESCRIPTION'] = df['DESCRIPTION'].fillna(df['NEUTRALDESCRIPTION'])
     
@@ -84,6 +85,7 @@ from datetime import datetime, timedelta
 from Models.xgboost_model import loadXGBModel
 from Models.xgboost_prediction import get_espn_games
 from PrizePicks.prizePicksPairsEV import prizePicksPairsEV
+from NBAData.historicalOddsStore import load_historical_odds
 
 def format_date_for_csv(date):
     return date.strftime('%m_%d_%Y')
@@ -92,6 +94,10 @@ def format_date_for_espn(date):
     return date.strftime('%Y%m%d')
 
 def process_date_range(start_date, end_date, propDict, models):
+    # One scan of the PrizePicks rows for the whole range instead of re-reading every day
+    all_prizepicks = load_historical_odds(start=start_date.strftime('%Y-%m-%d'), end=end_date.strftime('%Y-%m-%d'),
+                                          bookmakers=['PrizePicks'])
+    prizepicks_by_date = {date: rows for date, rows in all_prizepicks.groupby('GAME_DATE')}
     current_date = start_date
     while current_date <= end_date:
         print(f"\nProcessing {current_date.date()}")
@@ -111,10 +117,8 @@ def process_date_range(start_date, end_date, propDict, models):
                 current_date += timedelta(days=1)
                 continue
             
-            # Load bookmaker data for the current date
-            bookmakers = pd.read_csv('CSV_FILES/HISTORICAL_ODDS/ALL_HISTORICAL_ODDS.csv')
-            PrizePicks = bookmakers[(bookmakers['BOOKMAKER'] == 'PrizePicks') & 
-                                  (bookmakers['GAME_DATE'] == db_date)]
+            # Bookmaker data for the current date
+            PrizePicks = prizepicks_by_date.get(db_date, all_prizepicks.iloc[:0])
             
             # Check if we have any PrizePicks data for this date
             if PrizePicks.empty:
@@ -4,6 +4,7 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import multiprocessing as mp
 from datetime import datetime
+from NBAData.rateLimiter import nba_request
 
 def starters(data):
     starters = ['G','F','C']
@@ -12,14 +13,14 @@ def starters(data):
     else:
         return 0
     
-def assign_position(data, max_workers=4, delay_between_requests=0.5):
+def assign_position(data, max_workers=4, delay_between_requests=0):
     """
     Optimized version with parallel processing and caching
     
     Parameters:
     - data: DataFrame containing PLAYER_ID column
     - max_workers: Number of parallel threads (keep low to respect API limits)
-    - delay_between_requests: Delay between requests to avoid rate limiting
+    - delay_between_requests: Extra fixed delay per request (the shared rate limiter already paces them)
     """
     
     print("Extracting unique player IDs...")
@@ -34,8 +35,9 @@ def assign_position(data, max_workers=4, delay_between_requests=0.5):
     def fetch_player_position(player_id):
         """Fetch position, height, and weight for a single player"""
         try:
-            time.sleep(delay_between_requests)
-            player_info = commonplayerinfo.CommonPlayerInfo(player_id=player_id).get_data_frames()[0]
+            if delay_between_requests:
+                time.sleep(delay_between_requests)
+            player_info = nba_request(commonplayerinfo.CommonPlayerInfo, player_id=player_id).get_data_frames()[0]
             
             if not player_info.empty:
                 position = player_info.iloc[0]['POSITION']
@@ -103,7 +105,7 @@ def assign_position(data, max_workers=4, delay_between_requests=0.5):
     data = data.copy()
     return data
 
-def assign_position_with_cache(data, cache_file='playerInfo.csv', max_workers=4, delay_between_requests=0.5):
+def assign_position_with_cache(data, cache_file='playerInfo.csv', max_workers=4, delay_between_requests=0):
     """
     Enhanced version with persistent caching to avoid re-fetching known players
     
@@ -111,7 +113,7 @@ def assign_position_with_cache(data, cache_file='playerInfo.csv', max_workers=4,
     - data: DataFrame containing PLAYER_ID column
     - cache_file: Path to CSV file for caching player positions
     - max_workers: Number of parallel threads
-    - delay_between_requests: Delay between requests
+    - delay_between_requests: Extra fixed delay per request (the shared rate limiter already paces them)
     """
     
     print("Loading position cache...")
@@ -135,8 +137,9 @@ def assign_position_with_cache(data, cache_file='playerInfo.csv', max_workers=4,
         def fetch_player_position(player_id):
             """Fetch position, height, and weight for a single player"""
             try:
-                time.sleep(delay_between_requests)
-                player_info = commonplayerinfo.CommonPlayerInfo(player_id=player_id).get_data_frames()[0]
+                if delay_between_requests:
+                    time.sleep(delay_between_requests)
+                player_info = nba_request(commonplayerinfo.CommonPlayerInfo, player_id=player_id).get_data_frames()[0]
                 
                 if not player_info.empty:
                     position = player_info.iloc[0]['POSITION']
@@ -0,0 +1,130 @@
+"""
+One process-wide limiter for stats.nba.com requests.
+
+    from NBAData.rateLimiter import nba_request
+
+    log = nba_request(leaguegamelog.LeagueGameLog, season='2024-25').get_data_frames()[0]
+
+Requests are paced by a token bucket and capped by a concurrency window, both
+adjusted AIMD style: every success adds a little rate and window, a 429 or a
+timeout halves them and pauses everyone for an exponential backoff, and any
+other error leaves them as they are. Every thread shares the same limiter, so
+the box score pool, the position lookups and the play-by-play pulls settle on
+the rate the API tolerates together.
+Responses in NBAData.responseCache are served from disk before the limiter.
+"""
+import threading
+import time
+import requests
+from NBAData.responseCache import RESPONSE_CACHE
+
+THROTTLE_STATUS = {429, 503}
+
+def is_throttled(error):
+    # stats.nba.com mostly signals overload by hanging, so timeouts count as throttling too
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) in THROTTLE_STATUS
+
+class RateLimiter:
+    def __init__(self, rate=2.0, min_rate=0.2, max_rate=10.0, concurrency=2, max_concurrency=8,
+                 increase=0.1, max_retries=4, base_backoff=2.0, max_backoff=60.0):
+        self.rate = rate
+        self.increase = increase
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.concurrency = float(concurrency)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.tokens = 1.0
+        self.in_flight = 0
+        self.throttles = 0
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+
+    def _refill(self, now):
+        # Bucket holds about a second's worth of requests
+        self.tokens = min(max(1.0, self.rate), self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.paused_until and self.in_flight < int(self.concurrency) and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    return
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate, 0.01)
+                self._condition.wait(wait)
+
+    def release(self, throttled=False, succeeded=True):
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                self.throttles += 1
+                backoff = min(self.max_backoff, self.base_backoff * 2 ** (self.throttles - 1))
+                self.paused_until = max(self.paused_until, now + backoff)
+                # One decrease per congestion event, not one per request that was already in flight
+                if now - self.last_decrease > backoff:
+                    self.rate = max(self.min_rate, self.rate / 2)
+                    self.concurrency = max(1.0, self.concurrency / 2)
+                    self.last_decrease = now
+            elif succeeded:
+                # Any other failure says nothing about what the API tolerates, so only successes raise the rate
+                self.throttles = 0
+                # Additive increase: a fixed step per success, so a throttled rate climbs back gradually;
+                # the window grows by about one slot per window of clean responses
+                self.rate = min(self.max_rate, self.rate + self.increase)
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self._condition.notify_all()
+
+    def call(self, function, *args, **kwargs):
+        # Throttled calls are retried after the shared backoff; any other error is raised as is
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as e:
+                throttled = is_throttled(e)
+                self.release(throttled, succeeded=False)
+                if not throttled or attempt == self.max_retries:
+                    raise
+                print(f"[RATE LIMIT] {type(e).__name__}, backing off (rate {self.rate:.2f}/s, window {int(self.concurrency)})")
+                continue
+            self.release()
+            return result
+
+    def status(self):
+        with self._condition:
+            return {'rate': self.rate, 'concurrency': int(self.concurrency), 'in_flight': self.in_flight}
+
+LIMITER = RateLimiter()
+
+def send_request(request):
+    # nba_api hands back a 429 as a body it then fails to parse; surface the status instead
+    # Clear the last attempt's response so a failure here is never read as its status
+    request.nba_response = None
+    try:
+        request.get_request()
+    except Exception as e:
+        status = getattr(request.nba_response, '_status_code', None)
+        if status in THROTTLE_STATUS:
+            response = requests.Response()
+            response.status_code = status
+            raise requests.exceptions.HTTPError(f"{status} from {type(request).__name__}", response=response) from e
+        raise
+    return request
+
+def nba_request(endpoint, **kwargs):
+    # Built without sending, so the response cache can answer first and only misses hit the limiter
+    request = endpoint(get_request=False, **kwargs)
+    return RESPONSE_CACHE.fetch(request, lambda request: LIMITER.call(send_request, request))
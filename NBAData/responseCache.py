@@ -0,0 +1,127 @@
+"""
+On-disk cache of raw nba_api responses that no longer change, checked before
+the rate limiter so a hit costs no request at all.
+
+    <directory>/<Endpoint>/<ab>/<sha256>.json.gz
+
+The key is the sha256 of the endpoint name and its full parameter set, and the
+body is the gzipped JSON exactly as stats.nba.com sent it, parsed again by the
+endpoint's own load_response() on a hit.
+
+Game endpoints (box scores, play-by-play) are only stored once the game is
+final: either a league game log has listed it (markFinal) or its season is
+over. Player bios are stored with a max age instead, since a trade or a
+re-listed height does change them.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from nba_api.stats.library.http import NBAStatsResponse
+
+CACHE_DIRECTORY = 'REGULAR_DATA/NBA_API_CACHE'
+FINAL_GAMES = '_final_games.txt'
+
+# Endpoint name -> max age in seconds (None = immutable once the game is final)
+GAME_ENDPOINTS = {'BoxScoreAdvancedV2': None, 'PlayByPlayV2': None}
+PLAYER_ENDPOINTS = {'CommonPlayerInfo': 30 * 24 * 3600}
+
+def season_over(game_id, now=None):
+    # Game ids are 00<type><YY><number>; the YY season is done by July of the next year
+    game_id = str(game_id).zfill(10)
+    if not game_id[3:5].isdigit():
+        return False
+    return (now or datetime.now()) >= datetime(2000 + int(game_id[3:5]) + 1, 7, 1)
+
+class ResponseCache:
+    def __init__(self, directory=CACHE_DIRECTORY):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._final = None
+
+    def key(self, name, parameters):
+        payload = json.dumps({'endpoint': name, 'parameters': parameters}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path(self, name, key):
+        return os.path.join(self.directory, name, key[:2], f"{key}.json.gz")
+
+    def finalGames(self):
+        with self._lock:
+            if self._final is None:
+                try:
+                    with open(os.path.join(self.directory, FINAL_GAMES), 'r') as file:
+                        self._final = set(file.read().split())
+                except FileNotFoundError:
+                    self._final = set()
+            return self._final
+
+    def markFinal(self, game_ids):
+        # Game ids a league game log has listed, i.e. games that have been played
+        final = self.finalGames()
+        new = sorted({str(gid) for gid in game_ids} - final)
+        if not new:
+            return 0
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, FINAL_GAMES), 'a') as file:
+                file.write('\n'.join(new) + '\n')
+            final.update(new)
+        return len(new)
+
+    def isFinal(self, game_id):
+        return str(game_id) in self.finalGames() or season_over(game_id)
+
+    def cacheable(self, name, parameters):
+        if name in GAME_ENDPOINTS:
+            return self.isFinal(parameters.get('GameID'))
+        return name in PLAYER_ENDPOINTS
+
+    def read(self, name, key):
+        path = self.path(name, key)
+        max_age = GAME_ENDPOINTS.get(name, PLAYER_ENDPOINTS.get(name))
+        try:
+            if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+                return None
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                return file.read()
+        except (FileNotFoundError, OSError, EOFError):
+            return None
+
+    def write(self, name, key, raw):
+        path = self.path(name, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        with gzip.open(tmp, 'wt', encoding='utf-8') as file:
+            file.write(raw)
+        os.replace(tmp, path)
+
+    def fetch(self, request, send):
+        """
+        `request` is an endpoint built with get_request=False; `send` performs the
+        network call on it. Returns the endpoint with its data sets loaded.
+        """
+        name = type(request).__name__
+        if name not in GAME_ENDPOINTS and name not in PLAYER_ENDPOINTS:
+            return send(request)
+        key = self.key(name, request.parameters)
+        raw = self.read(name, key)
+        if raw is not None:
+            request.nba_response = NBAStatsResponse(response=raw, status_code=200, url=None)
+            request.load_response()
+            return request
+
+        send(request)
+        response = request.nba_response
+        # Only complete 200 responses with at least one row are worth keeping
+        if response._status_code == 200 and self.cacheable(name, request.parameters):
+            result_sets = response.get_dict().get('resultSets', [])
+            if any(result.get('rowSet') for result in result_sets):
+                self.write(name, key, response.get_response())
+        return request
+
+RESPONSE_CACHE = ResponseCache()
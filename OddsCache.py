@@ -0,0 +1,53 @@
+import hashlib
+import json
+import os
+import time
+from Supplier import Supplier
+
+class OddsCache():
+    """
+    On-disk response cache for the-odds-api.
+
+    Entries are raw JSON payloads keyed by (kind, sport, event, region, markets)
+    and expire per read: callers pass a long TTL for the event list and a short
+    one for prices.
+    """
+    def __init__(self, directory=None, events_ttl=3600, odds_ttl=300):
+        self.directory = directory or Supplier().getCacheDirectory()
+        self.events_ttl = events_ttl
+        self.odds_ttl = odds_ttl
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, kind, sport, event=None, region=None, markets=()):
+        return '|'.join([kind, sport, event or '', region or '', ','.join(sorted(markets))])
+
+    def path(self, key):
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.directory, key.split('|')[1], f"{digest}.json")
+
+    def get(self, key, ttl):
+        path = self.path(key)
+        try:
+            with open(path, 'r') as file:
+                entry = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if entry.get('key') != key or time.time() - entry['fetched_at'] > ttl:
+            return None
+        return entry['data']
+
+    def set(self, key, data):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{id(data)}.tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump({'key': key, 'fetched_at': time.time(), 'data': data}, file)
+        os.replace(tmp_path, path)
+
+    def clear(self, sport=None):
+        root = os.path.join(self.directory, sport) if sport else self.directory
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith('.json'):
+                    os.remove(os.path.join(dirpath, filename))
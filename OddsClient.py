@@ -0,0 +1,252 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from Supplier import Supplier
+from OddsCache import OddsCache
+from Fixtures import new_session
+from PlayerNames import normalize_name
+
+ODDS_COLUMNS = ['BOOKMAKER', 'CATEGORY', 'NAME', 'OVER/UNDER', 'LINE', 'ODDS']
+STRING_COLUMNS = ['BOOKMAKER', 'CATEGORY', 'NAME', 'OVER/UNDER']
+
+def create_session(pool_size=8):
+    # Keep-alive pool sized to the worker count so concurrent requests reuse
+    # connections (and their TLS sessions) instead of handshaking every call
+    session = new_session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+class OddsClient():
+    """
+    the-odds-api player-prop client shared by every sport's odds scraper.
+
+    Outcomes are parsed straight into column chunks (one per request, in event
+    order) and frame() assembles them into a single DataFrame with categorical
+    string columns. Responses are served from an
+    OddsCache while fresh unless force_refresh is set; cache=False disables it.
+    """
+    def __init__(self, sport, markets, region='us_dfs', max_workers=8, batch_size=None,
+                 start_times=None, players=None, time_window=timedelta(minutes=30), session=None,
+                 cache=True, force_refresh=False, timeout=15):
+        self.sport = sport
+        self.region = region
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        supplier = Supplier()
+        self.api_key = supplier.getKey()
+        self.base_url = f"{supplier.getOddsURL()}{sport}/events/"
+        self.session = session or create_session(max_workers)
+        self.cache = OddsCache() if cache is True else (cache or None)
+        self.force_refresh = force_refresh
+        # A stalled connection raises requests.Timeout, handled like any other failed request
+        self.timeout = timeout
+        # Only fetch what the PrizePicks board can be compared against (None = everything)
+        self.markets = list(markets)
+        self.start_times = None if start_times is None else [t if isinstance(t, datetime) else datetime.fromisoformat(t) for t in start_times]
+        self.players = None if players is None else {normalize_name(name) for name in players}
+        self.time_window = time_window
+        self.chunks = []
+        self.dataframe = self.frame()
+        self.events = []
+        self.ids = []
+        self.requests_made = 0
+        self.quota_cost = 0
+        self.requests_used = None
+        self.requests_remaining = None
+        self._quota_lock = threading.Lock()
+
+    def fetch(self):
+        self.chunks = []
+        self.ids = self.gameIDs()
+        self.collect_all_odds()
+        self.dataframe = self.frame()
+        return self.dataframe
+
+    def refresh(self):
+        # Re-query prices from the network regardless of what the cache holds
+        self.force_refresh = True
+        return self.fetch()
+
+    def request_json(self, url, params, cache_key, ttl, label=''):
+        # Cached payloads cost no quota; only fresh 200 responses are stored
+        if self.cache is not None and not self.force_refresh:
+            data = self.cache.get(cache_key, ttl)
+            if data is not None:
+                return data
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        if response.status_code != 200:
+            print(f"Failed to retrieve data{label}: {response.status_code}")
+            return None
+        # Save the last response
+        self.last_response = response
+        self.update_quota(response)
+        data = response.json()
+        if self.cache is not None:
+            self.cache.set(cache_key, data)
+        return data
+
+    def gameIDs(self):
+        params = {'apiKey': self.api_key, 'regions': 'us', 'markets': 'h2h', 'oddsFormat': 'american'}
+        cache_key = self.cache.key('events', self.sport) if self.cache is not None else None
+        try:
+            data = self.request_json(self.base_url, params, cache_key, self.cache.events_ttl if self.cache is not None else 0)
+            if data is None:
+                return []
+            self.events = [game for game in data if self.on_board(game)]
+            return [game['id'] for game in self.events]
+        except requests.RequestException as e:
+            print(f"Request failed: {e}")
+            return []
+
+    def get_odds(self, id, market_types):
+        # Accepts one market key or a list of them; returns one column chunk
+        if isinstance(market_types, str):
+            market_types = [market_types]
+        requested = ','.join(market_types)
+        params = {'apiKey': self.api_key, 'regions': self.region, 'markets': requested, 'oddsFormat': 'american'}
+        cache_key = self.cache.key('odds', self.sport, id, self.region, market_types) if self.cache is not None else None
+        try:
+            data = self.request_json(f"{self.base_url}{id}/odds", params, cache_key,
+                                     self.cache.odds_ttl if self.cache is not None else 0, f" for {requested}")
+            if data is None:
+                return self.parse_odds({'bookmakers': []}, market_types)
+            return self.parse_odds(data, market_types)
+        except requests.RequestException as e:
+            print(f"Request failed for {requested}: {e}")
+            return self.parse_odds({'bookmakers': []}, market_types)
+        except KeyError as e:
+            print(f"Unexpected response structure for {requested}: {e}")
+            return self.parse_odds({'bookmakers': []}, market_types)
+
+    def parse_odds(self, data, market_types):
+        # One pass over the payload, appending straight into per-column lists
+        wanted = set(market_types)
+        players = self.players
+        books, markets, names, sides, lines, prices = [], [], [], [], [], []
+        for bookmaker in data['bookmakers']:
+            title = bookmaker['title']
+            for market in bookmaker['markets']:
+                key = market['key']
+                if key not in wanted:
+                    continue
+                for outcome in market['outcomes']:
+                    # Yes/no markets have no 'point' and some outcomes no 'description'
+                    name = outcome.get('description', '')
+                    if players is not None and normalize_name(name) not in players:
+                        continue
+                    books.append(title)
+                    markets.append(key)
+                    names.append(name)
+                    sides.append(outcome['name'])
+                    lines.append(outcome.get('point'))
+                    prices.append(outcome['price'])
+        return {'BOOKMAKER': books, 'CATEGORY': markets, 'NAME': names, 'OVER/UNDER': sides, 'LINE': lines, 'ODDS': prices}
+
+    def frame(self):
+        # Preallocate every column once the row count is known, copy the chunks in,
+        # then dictionary-encode the string columns
+        total = sum(len(chunk['ODDS']) for chunk in self.chunks)
+        columns = {column: np.empty(total, dtype=object) for column in STRING_COLUMNS}
+        lines = np.full(total, np.nan)
+        prices = np.empty(total, dtype=float)
+        start = 0
+        for chunk in self.chunks:
+            stop = start + len(chunk['ODDS'])
+            for column in STRING_COLUMNS:
+                columns[column][start:stop] = chunk[column]
+            lines[start:stop] = chunk['LINE']
+            prices[start:stop] = chunk['ODDS']
+            start = stop
+
+        frame = pd.DataFrame({
+            'BOOKMAKER': pd.Categorical(columns['BOOKMAKER']),
+            'CATEGORY': pd.Categorical(columns['CATEGORY'], categories=self.markets),
+            'NAME': pd.Categorical(columns['NAME']),
+            'OVER/UNDER': pd.Categorical(columns['OVER/UNDER']),
+            'LINE': lines,
+            'ODDS': prices.astype(np.int64) if np.array_equal(prices, np.round(prices)) else prices,
+        })
+        # Group rows by market in MARKETS order, like the per-market maps used to
+        return frame.sort_values('CATEGORY', kind='stable', ignore_index=True)
+
+    def on_board(self, game):
+        # An event is worth pricing only if a PrizePicks projection starts around the same time
+        if self.start_times is None:
+            return True
+        commence = datetime.fromisoformat(game['commence_time'].replace('Z', '+00:00'))
+        return any(abs(commence - start) <= self.time_window for start in self.start_times)
+
+    def plan_requests(self, markets=None):
+        # Pack the wanted markets for each event into as few calls as possible
+        markets = self.markets if markets is None else markets
+        size = self.batch_size or len(markets)
+        if not markets:
+            return []
+        batches = [markets[i:i + size] for i in range(0, len(markets), size)]
+        return [(i, id, batch) for i, id in enumerate(self.ids) for batch in batches]
+
+    def update_quota(self, response):
+        # the-odds-api reports credit usage on every response; requests finish out
+        # of order, so keep the highest "used" and lowest "remaining" seen
+        used = response.headers.get('x-requests-used')
+        remaining = response.headers.get('x-requests-remaining')
+        last = response.headers.get('x-requests-last')
+        with self._quota_lock:
+            self.requests_made += 1
+            if last is not None:
+                self.quota_cost += float(last)
+            if used is not None:
+                self.requests_used = max(float(used), self.requests_used or 0)
+            if remaining is not None:
+                remaining = float(remaining)
+                self.requests_remaining = remaining if self.requests_remaining is None else min(remaining, self.requests_remaining)
+
+    def quota_report(self):
+        return {
+            'requests': self.requests_made,
+            'cost': self.quota_cost,
+            'used': self.requests_used,
+            'remaining': self.requests_remaining,
+        }
+
+    def collect_all_odds(self):
+        # Every planned (event, market batch) request runs on a bounded thread pool;
+        # chunks are put back in plan order so rows follow the event order.
+        jobs = self.plan_requests()
+        chunks = [None] * len(jobs)
+        if jobs:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(jobs)))) as executor:
+                futures = {executor.submit(self.get_odds, id, batch): (n, id) for n, (i, id, batch) in enumerate(jobs)}
+                for future in as_completed(futures):
+                    n, id = futures[future]
+                    try:
+                        chunks[n] = future.result()
+                    except Exception as e:
+                        print(f"[ERROR] Fetching odds for event {id}: {e}")
+        self.chunks.extend(chunk for chunk in chunks if chunk is not None)
+        report = self.quota_report()
+        print(f"Odds API: {report['requests']} requests, {report['cost']:g} credits used this run, {report['remaining']} remaining")
+
+class OddsScraper(OddsClient):
+    """
+    Base for the sport odds scrapers: a scraper only sets SPORT (the-odds-api sport key)
+    and MARKETS (market keys in the order the finder's frame groups them).
+    """
+    SPORT = None
+    MARKETS = []
+
+    def __init__(self, region='us_dfs', markets=None, **options):
+        # options (max_workers, batch_size, start_times, players, cache, force_refresh, ...) go to OddsClient
+        super().__init__(
+            self.SPORT,
+            [market for market in self.MARKETS if markets is None or market in markets],
+            region=region,
+            **options,
+        )
+        self.fetch()
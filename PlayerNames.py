@@ -0,0 +1,20 @@
+import re
+import unicodedata
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+@lru_cache(maxsize=None)
+def normalize_name(name):
+    # Books and PrizePicks disagree on accents, punctuation and suffixes
+    name = unicodedata.normalize('NFKD', name or '')
+    name = ''.join(c for c in name if not unicodedata.combining(c))
+    name = re.sub(r"[.'`]", "", name.casefold())
+    name = re.sub(r"\s+(jr|sr|ii|iii|iv)$", "", name)
+    return " ".join(name.split())
+
+def normalized(names):
+    # Normalize each distinct name once, then broadcast back to the rows
+    names = names.astype('category')
+    keys = np.array([normalize_name(str(name)) for name in names.cat.categories] + [None], dtype=object)
+    return pd.Series(keys[names.cat.codes.to_numpy()], index=names.index)
@@ -0,0 +1,80 @@
+import os
+import time
+from Supplier import Supplier
+from Projections import fetch_projections, parse_projections, projections_url, read_projections
+
+class PrizePicksScraperBase():
+    """
+    Everything the sport PrizePicks scrapers share. A scraper only sets LEAGUE_ID,
+    TIMEZONE (for START_TIME/GAME_DATE) and UNKNOWN_PLAYER (NAME when a player is missing).
+    """
+    LEAGUE_ID = None
+    TIMEZONE = None
+    UNKNOWN_PLAYER = None
+
+    def __init__(self, mode='http', lines=None):
+        # mode: 'http' fetches /projections directly (falling back to the saved file),
+        # 'file' only reads PROJECTIONS_DIRECTORY, 'browser' is the old Firefox save-dialog flow.
+        # lines: a board already parsed by Projections.load_boards, skips fetching entirely
+        supplier = Supplier()
+        self.directory = supplier.getDirectory()
+        if lines is not None:
+            self.setLines(lines)
+        elif mode == 'browser':
+            self.getJSON()
+            self.loadJSON()
+        elif mode == 'file':
+            self.loadJSON()
+        else:
+            data = fetch_projections(self.LEAGUE_ID)
+            if data is None:
+                data = self.savedProjections()
+            self.parseJSON(data or {'data': [], 'included': []})
+
+    def getJSON(self):
+        # Selenium/pyautogui are only needed for this flow, so import them here
+        from selenium import webdriver
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        import pyautogui as p
+
+        url = projections_url(self.LEAGUE_ID)
+        driver = webdriver.Firefox()
+        driver.get(url)
+
+        wait = WebDriverWait(driver, 10)
+        wait.until(EC.presence_of_element_located((By.ID, "json-tab")))
+        save_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn.save")))
+        save_button.click()
+        time.sleep(2)
+        p.press("enter")
+        time.sleep(.5)
+        p.press("left")
+        time.sleep(.5)
+        p.press("enter")
+        time.sleep(2)
+
+        driver.quit()
+
+    def savedProjections(self):
+        # The payload at PROJECTIONS_DIRECTORY, or None so the board comes up empty instead of crashing
+        if not self.directory:
+            print("No saved projections: PROJECTIONS_DIRECTORY is not set")
+            return None
+        if not os.path.exists(self.directory):
+            print(f"No saved projections at {self.directory}")
+            return None
+        print(f"Reading saved projections at {self.directory}")
+        return read_projections(self.directory)
+
+    def loadJSON(self):
+        self.parseJSON(self.savedProjections() or {'data': [], 'included': []})
+
+    def parseJSON(self, data):
+        # One row per projection: NAME, STAT_TYPE, LINE, ODDS_TYPE, START_TIME, GAME_DATE, ...
+        self.setLines(parse_projections(data, tz=self.TIMEZONE, unknown_player=self.UNKNOWN_PLAYER))
+
+    def setLines(self, lines):
+        self.lines = lines
+        self.start_times = set(lines['START_TIME'].unique())
@@ -0,0 +1,109 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from Supplier import Supplier
+from Fixtures import new_session
+from OddsClient import create_session
+
+# PrizePicks rejects requests that don't look like a browser asking for JSON
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0',
+    'Accept': 'application/json',
+}
+
+def projections_url(league_id):
+    return f"{Supplier().getPrizePicksURL()}projections?league_id={league_id}"
+
+def fetch_projections(league_id, session=None, timeout=15):
+    """
+    GET /projections for one league and return the decoded JSON, or None on failure.
+    """
+    session = session or new_session()
+    try:
+        response = session.get(projections_url(league_id), headers=HEADERS, timeout=timeout)
+        if response.status_code == 200:
+            return response.json()
+        print(f"Failed to retrieve PrizePicks league {league_id}: {response.status_code}")
+    except Exception as e:
+        print(f"PrizePicks request failed for league {league_id}: {e}")
+    return None
+
+def read_projections(path):
+    # An already-saved /projections payload (e.g. from the browser save dialog)
+    with open(path, 'r') as file:
+        return json.load(file)
+
+def player_lookup(payloads):
+    # new_player id -> name across every payload; ids are global on PrizePicks
+    return {elem['id']: elem['attributes']['name']
+            for data in payloads for elem in data['included'] if elem['type'] == 'new_player'}
+
+def parse_projections(data, tz='America/Los_Angeles', unknown_player=None, player_names=None):
+    """
+    Flatten a /projections payload into a typed DataFrame, one row per projection.
+
+    Fields are pulled in a single pass; start times are converted to `tz` for the
+    whole column at once, and only the distinct kickoff times get string-formatted.
+    `player_names` is an already-built id -> name lookup (see player_lookup).
+    """
+    if player_names is None:
+        player_names = player_lookup([data])
+
+    projection_ids, player_ids, line_scores, stat_types, odds_types, flash_sales, start_times = [], [], [], [], [], [], []
+    for proj in data['data']:
+        if proj['type'] != 'projection':
+            continue
+        attributes = proj['attributes']
+        projection_ids.append(proj['id'])
+        player_ids.append(proj['relationships']['new_player']['data']['id'])
+        line_scores.append(attributes['line_score'])
+        stat_types.append(attributes['stat_type'])
+        odds_types.append(attributes.get('odds_type'))
+        flash_sales.append(attributes.get('flash_sale_line_score'))
+        start_times.append(attributes['start_time'])
+
+    # A board has thousands of projections but only a handful of distinct start times
+    codes, unique_starts = pd.factorize(pd.Series(start_times, dtype=object))
+    local = pd.to_datetime(pd.Series(unique_starts, dtype=object), utc=True).dt.tz_convert(tz)
+    formatted = (local.dt.strftime('%b-') + local.dt.day.astype(str) + local.dt.strftime('-%Y %I:%M %p')).to_numpy()
+
+    names = pd.Series(player_ids, dtype=object).map(player_names)
+    if unknown_player is not None:
+        names = names.fillna(unknown_player)
+    return pd.DataFrame({
+        'PROJECTION_ID': pd.Series(projection_ids, dtype=object),
+        'PLAYER_ID': pd.Series(player_ids, dtype=object),
+        'NAME': pd.Categorical(names),
+        'STAT_TYPE': pd.Categorical(stat_types),
+        'LINE': pd.Series(line_scores, dtype=float),
+        'ODDS_TYPE': pd.Categorical(odds_types),
+        'FLASH_SALE_LINE': pd.Series(flash_sales, dtype=float),
+        'START_TIME': pd.Series(local.to_numpy()[codes] if len(codes) else [], dtype=local.dtype),
+        'GAME_DATE': pd.Series(formatted[codes] if len(codes) else [], dtype=object),
+    })
+
+def load_boards(league_ids, tz='America/Los_Angeles', unknown_player=None, session=None, max_workers=None):
+    """
+    Fetch several leagues' projections at once and parse them into {league_id: DataFrame}.
+
+    All requests share one pooled session and run concurrently, so the whole pull
+    takes about as long as the slowest league. `tz` and `unknown_player` are either
+    one value for every league or a {league_id: value} dict. Leagues that fail to
+    load get an empty board.
+    """
+    league_ids = list(league_ids)
+    if not league_ids:
+        return {}
+    workers = max_workers or len(league_ids)
+    session = session or create_session(workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        payloads = list(executor.map(lambda league_id: fetch_projections(league_id, session=session), league_ids))
+    payloads = [data or {'data': [], 'included': []} for data in payloads]
+
+    player_names = player_lookup(payloads)
+    boards = {}
+    for league_id, data in zip(league_ids, payloads):
+        league_tz = tz.get(league_id, 'America/Los_Angeles') if isinstance(tz, dict) else tz
+        unknown = unknown_player.get(league_id) if isinstance(unknown_player, dict) else unknown_player
+        boards[league_id] = parse_projections(data, tz=league_tz, unknown_player=unknown, player_names=player_names)
+    return boards
@@ -1,8 +1,125 @@
-from NBAPropFinder.NBAPropFinder import NBAPropFinder
-from WNBAPropFinder.WNBAPropFinder import WNBAPropFinder
-from MLBPropFinder.MLBPropFinder import MLBPropFinder
-
-# recomend using one of these at a time
-# nba_props = NBAPropFinder(region='us_dfs')
-# wnba_props = WNBAPropFinder(region='us_dfs')
-mlb_props = MLBPropFinder(region='us_dfs')
+"""
+Command line entry point for the prop finders.
+
+    python PropFinder.py mlb
+    python PropFinder.py nba wnba --output CSV_FILES/board.csv
+    python PropFinder.py nba --poll 60
+    python PropFinder.py nba --poll 60 --snapshot
+
+Each sport's finder (and pandas/requests/selenium behind it) is imported only
+when that sport is selected, so --help and single-sport runs start quickly.
+"""
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+# sport -> ("module:Finder", "module:PrizePicks scraper")
+SPORTS = {
+    'nba': ('NBAPropFinder.NBAPropFinder:NBAPropFinder', 'NBAPropFinder.PrizePicks_Scraper:PrizePicks_Scraper'),
+    'wnba': ('WNBAPropFinder.WNBAPropFinder:WNBAPropFinder', 'WNBAPropFinder.PrizePicks_WNBA_Scraper:PRIZEPICKS_WNBA_SCRAPER'),
+    'mlb': ('MLBPropFinder.MLBPropFinder:MLBPropFinder', 'MLBPropFinder.PrizePicks_MLB_Scraper:PRIZEPICKS_MLB_SCRAPER'),
+}
+
+# Seconds `import PropFinder` / `PropFinder.py --help` may take, and what must not load with it
+STARTUP_BUDGET = 1.0
+HEAVY_MODULES = ['pandas', 'numpy', 'requests', 'selenium', 'pyautogui']
+
+def load(path):
+    module, name = path.split(':')
+    return getattr(importlib.import_module(module), name)
+
+def load_finder(sport):
+    return load(SPORTS[sport][0])
+
+def load_prizepicks_boards(sports):
+    # One concurrent PrizePicks pull for every selected league instead of one per finder
+    from Projections import load_boards
+    scrapers = {sport: load(SPORTS[sport][1]) for sport in sports}
+    boards = load_boards([scraper.LEAGUE_ID for scraper in scrapers.values()],
+                         tz={scraper.LEAGUE_ID: scraper.TIMEZONE for scraper in scrapers.values()},
+                         unknown_player={scraper.LEAGUE_ID: scraper.UNKNOWN_PLAYER for scraper in scrapers.values()})
+    return {sport: boards[scraper.LEAGUE_ID] for sport, scraper in scrapers.items()}
+
+def startup_check(budget=STARTUP_BUDGET):
+    """
+    Time `import PropFinder` and `PropFinder.py --help` in fresh interpreters.
+    Returns True when both fit in the budget and no heavy module was imported.
+    """
+    probe = ("import sys, time; start = time.perf_counter(); import PropFinder; "
+             "print(time.perf_counter() - start); "
+             f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True).stdout.splitlines()
+    import_time, loaded = float(output[0]), output[1] if len(output) > 1 else ''
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, __file__, '--help'], capture_output=True, check=True)
+    help_time = time.perf_counter() - start
+
+    ok = import_time < budget and help_time < budget and not loaded
+    print(f"import PropFinder: {import_time:.3f}s, --help: {help_time:.3f}s (budget {budget:g}s)")
+    if loaded:
+        print(f"Heavy modules imported at startup: {loaded}")
+    print("Startup check passed" if ok else "Startup check FAILED")
+    return ok
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare PrizePicks lines against sportsbook player props')
+    parser.add_argument('sports', nargs='*', metavar='SPORT',
+                        help=f"one or more of: {', '.join(sorted(SPORTS))}")
+    parser.add_argument('--region', default='us_dfs')
+    parser.add_argument('--max-workers', type=int, default=8)
+    parser.add_argument('--prizepicks-mode', choices=['http', 'file', 'browser'], default='http')
+    parser.add_argument('--all-markets', action='store_true', help='price every market, not just those on the PrizePicks board')
+    parser.add_argument('--force-refresh', action='store_true', help='ignore the odds cache')
+    parser.add_argument('--output', help='write the odds board to this CSV (one file per sport when several are selected)')
+    parser.add_argument('--poll', type=float, metavar='SECONDS', help='keep polling one sport and print line movement')
+    parser.add_argument('--snapshot', action='store_true', help='save every fetched board to the snapshot store')
+    parser.add_argument('--startup-check', action='store_true', help='verify startup stays within the import-time budget')
+    args = parser.parse_args(argv)
+
+    if args.startup_check:
+        return 0 if startup_check() else 1
+    if not args.sports:
+        parser.error('pick at least one sport')
+    unknown = [sport for sport in args.sports if sport not in SPORTS]
+    if unknown:
+        parser.error(f"unknown sport(s): {', '.join(unknown)} (choose from {', '.join(sorted(SPORTS))})")
+    if args.poll and len(args.sports) > 1:
+        parser.error('--poll follows a single sport')
+
+    boards = {}
+    if len(args.sports) > 1 and args.prizepicks_mode == 'http':
+        boards = load_prizepicks_boards(args.sports)
+
+    store = None
+    if args.snapshot:
+        from SnapshotStore import SnapshotStore
+        store = SnapshotStore()
+
+    finders = {}
+    for sport in args.sports:
+        finder = load_finder(sport)(region=args.region, max_workers=args.max_workers,
+                                    demand_driven=not args.all_markets, force_refresh=args.force_refresh,
+                                    prizepicks_mode=args.prizepicks_mode, prizepicks_board=boards.get(sport))
+        finders[sport] = finder
+        print(finder.dataframe)
+        if args.output:
+            root, ext = os.path.splitext(args.output)
+            path = args.output if len(args.sports) == 1 else f'{root}_{sport}{ext or ".csv"}'
+            finder.dataframe.to_csv(path, index=False)
+        # When polling, poll() saves the first board along with every refresh
+        if store is not None and not args.poll:
+            finder.saveSnapshot(store)
+
+    if args.poll:
+        finder = finders[args.sports[0]]
+        for changes in finder.poll(interval=args.poll, snapshot_store=store):
+            if not changes.empty:
+                print(changes)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+import LineMovement
+import Comparison
+from SnapshotStore import SnapshotStore
+
+class PropFinderBase():
+    """
+    Everything the sport finders share. A finder only sets its scrapers and
+    CATEGORY_MARKETS (PrizePicks stat_type -> the-odds-api market keys that can price it).
+    """
+    ODDS_SCRAPER = None
+    PRIZEPICKS_SCRAPER = None
+    CATEGORY_MARKETS = {}
+
+    def __init__(self, region='us_dfs', max_workers=8, demand_driven=True, force_refresh=False, prizepicks_mode='http', prizepicks_board=None):
+        # PrizePicks goes first so the odds pull can be limited to what is on the board
+        print("Scraping PrizePicks...")
+        self.prizepicks = self.PRIZEPICKS_SCRAPER(mode=prizepicks_mode, lines=prizepicks_board)
+        self.prizepicks_data = self.prizepicks.lines
+        print("Scraping Odds API...")
+        board = self.boardFilters() if demand_driven else {}
+        self.odds_data = self.ODDS_SCRAPER(region=region, max_workers=max_workers, force_refresh=force_refresh, **board)
+        print("Organizing Data...")
+        self.organizeData()
+        self.dataframe = self.getDataFrame()
+
+    def wantedMarkets(self):
+        markets = []
+        for category in sorted(self.prizepicks_data['STAT_TYPE'].unique()):
+            for market in self.CATEGORY_MARKETS.get(category, []):
+                if market not in markets:
+                    markets.append(market)
+        return markets
+
+    def boardFilters(self):
+        # Restrict the odds pull to markets, games and players on the PrizePicks board
+        if self.prizepicks_data.empty:
+            # No board (fetch blocked, no saved file): fall back to pulling every market
+            print("Warning: PrizePicks board is empty, fetching the full odds board")
+            return {}
+        return {
+            'markets': self.wantedMarkets(),
+            'start_times': self.prizepicks.start_times,
+            'players': set(self.prizepicks_data['NAME'].dropna().unique()),
+        }
+
+    def refreshOdds(self):
+        # Re-price the same board: fresh odds, same PrizePicks lines
+        self.odds_data.refresh()
+        self.organizeData()
+        self.dataframe = self.getDataFrame()
+        return self.dataframe
+
+    def poll(self, interval=60, max_polls=None, log_file=None, snapshot_store=None):
+        # Yields only the rows whose LINE/ODDS moved since the previous poll; see LineMovement.poll
+        return LineMovement.poll(self, interval=interval, max_polls=max_polls, log_file=log_file, snapshot_store=snapshot_store)
+
+    def compare(self):
+        # One row per PrizePicks projection with every book's nearest line and prices; see Comparison.compare_board
+        return Comparison.compare_board(self.prizepicks_data, self.dataframe, self.CATEGORY_MARKETS)
+
+    def saveSnapshot(self, store=None, snapshot_time=None):
+        # Odds and the PrizePicks board go to their own datasets under the same snapshot time
+        store = store or SnapshotStore()
+        sport = self.odds_data.sport
+        return {
+            'odds': store.write(self.dataframe, sport, 'odds', snapshot_time),
+            'prizepicks': store.write(self.prizepicks_data, sport, 'prizepicks', snapshot_time),
+        }
+
+    def organizeData(self):
+        # The PrizePicks categories on the board
+        self.categories = set(self.prizepicks_data['STAT_TYPE'].unique())
+
+    def getDataFrame(self):
+        # The odds client already parsed every market into one columnar frame
+        return self.odds_data.dataframe
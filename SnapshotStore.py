@@ -0,0 +1,82 @@
+import os
+import uuid
+from datetime import datetime, timezone
+import pandas as pd
+from Supplier import Supplier
+
+# Repeated strings are stored once per file as Parquet dictionaries
+DICTIONARY_COLUMNS = ['BOOKMAKER', 'CATEGORY', 'NAME', 'OVER/UNDER', 'STAT_TYPE', 'ODDS_TYPE', 'GAME_DATE']
+
+class SnapshotStore():
+    """
+    Parquet store for odds / PrizePicks snapshots, laid out as
+
+        <directory>/<dataset>/sport=<sport>/date=<YYYY-MM-DD>/<time>-<id>.parquet
+
+    Every write is its own file, so nothing is ever rewritten; empty frames are skipped. read() goes through
+    pyarrow.dataset: partitions outside the date/sport range are never opened and
+    book/market filters are pushed down to the row groups.
+    """
+    def __init__(self, directory=None, compression='zstd'):
+        self.directory = directory or Supplier().getSnapshotDirectory()
+        self.compression = compression
+
+    def partition(self, dataset, sport, date):
+        return os.path.join(self.directory, dataset, f"sport={sport}", f"date={date}")
+
+    def write(self, frame, sport, dataset='odds', snapshot_time=None):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if frame.empty:
+            return None
+        # Naive times are taken as local; partitions use the local date like the CSV logs
+        snapshot_time = (snapshot_time or datetime.now(timezone.utc)).astimezone()
+        frame = frame.copy()
+        for column in DICTIONARY_COLUMNS:
+            if column in frame.columns:
+                frame[column] = frame[column].astype('category')
+        for column in frame.select_dtypes(include=['datetimetz']).columns:
+            frame[column] = frame[column].dt.tz_convert('UTC')
+        frame['SNAPSHOT_TIME'] = pd.Timestamp(snapshot_time).tz_convert('UTC')
+
+        directory = self.partition(dataset, sport, snapshot_time.strftime('%Y-%m-%d'))
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{snapshot_time.strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet")
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        # Same dictionary type in every file, whatever its cardinality, so the files read back as one dataset
+        schema = pa.schema([pa.field(field.name, pa.dictionary(pa.int32(), pa.string())) if field.name in DICTIONARY_COLUMNS else field
+                            for field in table.schema], metadata=table.schema.metadata)
+        table = table.cast(schema)
+        pq.write_table(table, path, compression=self.compression)
+        return path
+
+    def read(self, dataset='odds', sport=None, start=None, end=None, books=None, markets=None, columns=None):
+        """
+        Load snapshots, filtered by sport, date range (inclusive, 'YYYY-MM-DD' or date),
+        bookmakers and markets (CATEGORY). Returns an empty DataFrame if nothing matches.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        root = os.path.join(self.directory, dataset)
+        if not os.path.isdir(root):
+            return pd.DataFrame(columns=columns)
+        partitioning = ds.partitioning(pa.schema([('sport', pa.string()), ('date', pa.string())]), flavor='hive')
+        data = ds.dataset(root, format='parquet', partitioning=partitioning)
+
+        filters = []
+        if sport is not None:
+            filters.append(ds.field('sport') == sport)
+        if start is not None:
+            filters.append(ds.field('date') >= str(start))
+        if end is not None:
+            filters.append(ds.field('date') <= str(end))
+        if books is not None:
+            filters.append(ds.field('BOOKMAKER').isin(list(books)))
+        if markets is not None:
+            filters.append(ds.field('CATEGORY').isin(list(markets)))
+        expression = None
+        for condition in filters:
+            expression = condition if expression is None else expression & condition
+        return data.to_table(columns=columns, filter=expression).to_pandas()
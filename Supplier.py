@@ -7,6 +7,13 @@ class Supplier():
     def __init__(self):
         self.api_key = os.environ.get('ODDS_API_KEY')
         self.directory = os.environ.get('PROJECTIONS_DIRECTORY')
+        self.cache_directory = os.environ.get('ODDS_CACHE_DIRECTORY', '.odds_cache')
+        # Overridable so the scrapers can be pointed at a local fixture server
+        self.odds_url = os.environ.get('ODDS_API_URL', 'https://api.the-odds-api.com/v4/sports/')
+        self.prizepicks_url = os.environ.get('PRIZEPICKS_API_URL', 'https://api.prizepicks.com/')
+        self.espn_url = os.environ.get('ESPN_API_URL', 'http://site.api.espn.com/apis/site/v2/sports/')
+        self.record_directory = os.environ.get('FIXTURE_RECORD_DIRECTORY')
+        self.snapshot_directory = os.environ.get('SNAPSHOT_DIRECTORY', 'SNAPSHOTS')
     
     def getKey(self):
         return self.api_key
@@ -14,4 +21,20 @@ class Supplier():
     def getDirectory(self):
         return self.directory
     
+    def getCacheDirectory(self):
+        return self.cache_directory
     
+    def getOddsURL(self):
+        return self.odds_url
+    
+    def getPrizePicksURL(self):
+        return self.prizepicks_url
+    
+    def getESPNURL(self):
+        return self.espn_url
+    
+    def getRecordDirectory(self):
+        return self.record_directory
+    
+    def getSnapshotDirectory(self):
+        return self.snapshot_directory
\ No newline at end of file